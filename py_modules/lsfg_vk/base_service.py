@@ -2,15 +2,17 @@
 Base service class with common functionality.
 """
 
-import logging
 import os
-import shutil
+import tempfile
 from pathlib import Path
-from typing import Any, Optional, TypeVar, Dict
+from typing import Any, Optional, TypeVar, Dict, Tuple
 
 import decky
 
-from .constants import LOCAL_LIB, LOCAL_SHARE_BASE, VULKAN_LAYER_DIR, SCRIPT_NAME, CONFIG_DIR, CONFIG_FILENAME
+from .constants import LOCAL_LIB, VULKAN_LAYER_DIR, SCRIPT_NAME, CONFIG_DIR, CONFIG_FILENAME, BIN_DIR
+
+# Plugin root (three levels up from py_modules/lsfg_vk/base_service.py)
+PLUGIN_DIR = Path(__file__).parent.parent.parent
 
 ResponseType = TypeVar('ResponseType', bound=Dict[str, Any])
 
@@ -36,13 +38,27 @@ class BaseService:
         self.lsfg_launch_script_path = self.user_home / SCRIPT_NAME
         self.config_dir = self.user_home / CONFIG_DIR
         self.config_file_path = self.config_dir / CONFIG_FILENAME
+        self.plugin_bin_dir = PLUGIN_DIR / BIN_DIR
     
     def _ensure_directories(self) -> None:
         """Create necessary directories if they don't exist"""
         self.local_lib_dir.mkdir(parents=True, exist_ok=True)
         self.local_share_dir.mkdir(parents=True, exist_ok=True)
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.log.info(f"Ensured directories exist: {self.local_lib_dir}, {self.local_share_dir}, {self.config_dir}")
+        self.log.info("Ensured directories exist: %s, %s, %s", self.local_lib_dir, self.local_share_dir, self.config_dir)
+    
+    @staticmethod
+    def _get_file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+        """Get a file's (mtime in nanoseconds, inode, size), or None if it doesn't exist
+        
+        The inode and size catch replacements that keep or share an mtime tick,
+        e.g. `cp -p` or coarse timestamps on SD card filesystems.
+        """
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return st.st_mtime_ns, st.st_ino, st.st_size
     
     def _remove_if_exists(self, path: Path) -> bool:
         """Remove a file if it exists
@@ -56,40 +72,64 @@ class BaseService:
         Raises:
             OSError: If removal fails
         """
-        if path.exists():
-            try:
-                path.unlink()
-                self.log.info(f"Removed {path}")
-                return True
-            except OSError as e:
-                self.log.error(f"Failed to remove {path}: {e}")
-                raise
-        else:
-            self.log.info(f"File not found: {path}")
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            self.log.info("File not found: %s", path)
             return False
+        except OSError as e:
+            self.log.error("Failed to remove %s: %s", path, e)
+            raise
+        self.log.info("Removed %s", path)
+        return True
     
-    def _write_file(self, path: Path, content: str, mode: int = 0o644) -> None:
-        """Write content to a file
+    def _atomic_write(self, path: Path, content: str, mode: int = 0o644, durable: bool = False) -> None:
+        """Write content to a temporary file and swap it into place
+        
+        Readers (e.g. a game being launched through ~/lsfg) only ever see
+        the old or the new file, never a partially written one. The write is
+        skipped when the file already has this content and mode. A symlinked
+        target (e.g. a dotfiles-managed conf.toml) is written through, so the
+        link itself is kept.
         
         Args:
             path: Target file path
             content: Content to write
             mode: File permissions (default: 0o644)
+            durable: fsync the new content before swapping it in (default: False)
             
         Raises:
             OSError: If write fails
         """
+        path = path.resolve()
+        data = content.encode('utf-8')
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
-                f.flush()
-                os.fsync(f.fileno())
-            
-            path.chmod(mode)
-            self.log.info(f"Wrote to {path}")
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if st.st_size == len(data) and st.st_mode & 0o777 == mode and f.read() == data:
+                    self.log.debug("%s is unchanged, skipping write", path)
+                    return
+        except FileNotFoundError:
+            pass
+        
+        tmp_path = None
+        try:
+            # A unique temp name, so overlapping writers never share a file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                # mkstemp always creates the file as 0600
+                os.fchmod(fd, mode)
+                f.write(data)
+                if durable:
+                    f.flush()
+                    os.fsync(fd)
+            os.replace(tmp_path, path)
+            self.log.info("Wrote to %s", path)
             
-        except (OSError, IOError, PermissionError) as e:
-            self.log.error(f"Failed to write to {path}: {e}")
+        except OSError as e:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            self.log.error("Failed to write to %s: %s", path, e)
             raise
 
     def _success_response(self, response_type: type, message: str = "", **kwargs) -> Any:
@@ -8,12 +8,13 @@ This module defines the complete configuration structure for lsfg-vk, managing T
 - Type definitions
 """
 
+import io
 import logging
 import re
 import sys
-from typing import TypedDict, Dict, Any, Union, cast, List
+from typing import TypedDict, Callable, Dict, Any, TextIO, Tuple, Union, cast
 from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 # Import shared configuration constants
@@ -21,10 +22,23 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from shared_config import CONFIG_SCHEMA_DEF, ConfigFieldType, get_field_names, get_defaults, get_field_types
 
 # Import auto-generated configuration components
-from .config_schema_generated import ConfigurationData, get_script_parsing_logic, get_script_generation_logic
+from .config_schema_generated import ConfigurationData, get_script_parsing_logic
 
+__all__ = [
+    'ConfigField',
+    'ConfigFieldType',
+    'ConfigurationData',
+    'ConfigurationManager',
+    'ProfileData',
+    'CONFIG_SCHEMA',
+    'SCRIPT_ONLY_FIELDS',
+    'COMPLETE_CONFIG_SCHEMA',
+    'DEFAULT_PROFILE_NAME',
+    'GLOBAL_SECTION_FIELDS',
+]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ConfigField:
     """Configuration field definition"""
     name: str
@@ -68,17 +82,191 @@ SCRIPT_ONLY_FIELDS = {
     if field_def.get("location") == "script"
 }
 
+# Script-only field names, frozen for the per-load merge loop
+_SCRIPT_ONLY_KEYS = tuple(SCRIPT_ONLY_FIELDS)
+
 # Complete configuration schema (TOML + script-only fields)
 COMPLETE_CONFIG_SCHEMA = {**CONFIG_SCHEMA, **SCRIPT_ONLY_FIELDS}
 
+# Per-field converters and defaults, resolved once from the field types
+_TYPE_CONVERTERS = {
+    ConfigFieldType.BOOLEAN: bool,
+    ConfigFieldType.INTEGER: int,
+    ConfigFieldType.FLOAT: float,
+    ConfigFieldType.STRING: str,
+}
+_FIELD_CONVERTERS = {
+    field_name: _TYPE_CONVERTERS[field_def.field_type]
+    for field_name, field_def in COMPLETE_CONFIG_SCHEMA.items()
+}
+_FIELD_DEFAULTS = {
+    field_name: field_def.default
+    for field_name, field_def in COMPLETE_CONFIG_SCHEMA.items()
+}
+
+
+def _parse_bool_text(text: str) -> bool:
+    return text.lower() in ('true', '1', 'yes', 'on')
+
+
+# Parsers from TOML value text to the field's Python type, shared by the
+# tomllib and lenient parsing paths
+_TEXT_PARSERS = {
+    ConfigFieldType.BOOLEAN: _parse_bool_text,
+    ConfigFieldType.INTEGER: int,
+    ConfigFieldType.FLOAT: float,
+    ConfigFieldType.STRING: str,
+}
+_TOML_VALUE_PARSERS = {
+    field_name: _TEXT_PARSERS[field_def.field_type]
+    for field_name, field_def in CONFIG_SCHEMA.items()
+}
+
+# One meaningful line for the lenient parser: a [section] header or a
+# key = value pair (double-quoted, single-quoted or bare value, quotes
+# stripped), each with an optional trailing comment. Blank and comment-only
+# lines simply don't match.
+_LINE_RE = re.compile(
+    r"""^[ \t]*(?:(?P<section>\[[^\r\n]*\])"""
+    r"""|(?P<key>[A-Za-z_][A-Za-z0-9_-]*)[ \t]*=[ \t]*"""
+    r"""(?:"(?P<dq>[^"\r\n]*)"|'(?P<sq>[^'\r\n]*)'|(?P<bare>[^#\r\n]*?)))"""
+    r"""[ \t\r]*(?:#[^\r\n]*)?$""",
+    re.MULTILINE
+)
+
+# Section states for the lenient parser
+_SECTION_NONE, _SECTION_GLOBAL, _SECTION_GAME = range(3)
+
 # Constants for profile management
 DEFAULT_PROFILE_NAME = "decky-lsfg-vk"
 GLOBAL_SECTION_FIELDS = {"dll", "no_fp16"}
 
+# TOML spelling of booleans
+_BOOL_STR = {True: "true", False: "false"}
+
+# Characters that must be escaped inside a TOML basic string
+_TOML_ESCAPES = {
+    ord('"'): '\\"',
+    ord('\\'): '\\\\',
+    **{code: f"\\u{code:04x}" for code in (*range(0x20), 0x7f)},
+}
+
+
+def _toml_str(value: Any) -> str:
+    """Quote a value as a TOML basic string"""
+    return f'"{str(value).translate(_TOML_ESCAPES)}"'
+
+# Fixed-shape chunks of the generated TOML file; each ends with a newline and
+# write_toml emits the blank line that separates it from the next chunk
+_GLOBAL_SECTION_TEMPLATE = (
+    'version = 1\n'
+    '\n'
+    '[global]\n'
+    '# Currently selected profile\n'
+    'current_profile = {current_profile}\n'
+    '\n'
+    '{dll_block}'
+    '\n'
+    '# FP16 acceleration\n'
+    'no_fp16 = {no_fp16}\n'
+)
+_DLL_BLOCK_TEMPLATE = (
+    '# specify where Lossless.dll is stored\n'
+    'dll = {dll}\n'
+)
+_GAME_HEADER_TEMPLATE = (
+    '[[game]]\n'
+    '{comment}\n'
+    'exe = {exe}\n'
+)
+
+
+def _bool_formatter(name: str, comment: str) -> Callable[[Any], str]:
+    return lambda value: f"{comment}\n{name} = {_BOOL_STR[bool(value)]}\n"
+
+
+def _number_formatter(name: str, comment: str) -> Callable[[Any], str]:
+    # Always include numbers, even if 0 or 1
+    return lambda value: f"{comment}\n{name} = {value}\n"
+
+
+def _string_formatter(name: str, comment: str) -> Callable[[Any], str]:
+    # Only add non-empty strings; the comment is written either way
+    empty_block = f"{comment}\n"
+    return lambda value: f"{comment}\n{name} = {_toml_str(value)}\n" if value else empty_block
+
+
+# Block formatter for each game-section field, in schema order. The field
+# type and the description comment are resolved once here; each block is the
+# comment, the value line and the blank line that follows it.
+_FORMATTER_FACTORIES = {
+    ConfigFieldType.BOOLEAN: _bool_formatter,
+    ConfigFieldType.INTEGER: _number_formatter,
+    ConfigFieldType.FLOAT: _number_formatter,
+    ConfigFieldType.STRING: _string_formatter,
+}
+_GAME_FIELD_FORMATTERS = [
+    (
+        field_name,
+        field_def.default,
+        _FORMATTER_FACTORIES[field_def.field_type](field_name, f"\n# {field_def.description}"),
+    )
+    for field_name, field_def in CONFIG_SCHEMA.items()
+    if field_name not in GLOBAL_SECTION_FIELDS
+]
+
 # Note: ConfigurationData is now imported from generated file
 # No need to manually maintain the TypedDict anymore!
 
 
+@lru_cache(maxsize=1)
+def _compute_defaults() -> Dict[str, Any]:
+    """Build the default configuration once; the schema is fixed at import time"""
+    # Use shared defaults and add script-only fields
+    shared_defaults = get_defaults()
+    
+    # Add script-only fields that aren't in the shared schema
+    script_defaults = {
+        field.name: field.default 
+        for field in SCRIPT_ONLY_FIELDS.values()
+    }
+    
+    return {**shared_defaults, **script_defaults}
+
+
+@lru_cache(maxsize=1)
+def _compute_field_names() -> Tuple[str, ...]:
+    """Build the ordered field names once"""
+    # Use shared field names and add script-only fields
+    return tuple(get_field_names()) + tuple(SCRIPT_ONLY_FIELDS.keys())
+
+
+@lru_cache(maxsize=1)
+def _compute_field_types() -> Dict[str, ConfigFieldType]:
+    """Build the field type mapping once"""
+    # Use shared field types and add script-only field types
+    shared_types = {name: ConfigFieldType(type_str) for name, type_str in get_field_types().items()}
+    script_types = {field.name: field.field_type for field in SCRIPT_ONLY_FIELDS.values()}
+    return {**shared_types, **script_types}
+
+
+@lru_cache(maxsize=1)
+def _load_tomllib():
+    """Import the TOML parser on first use rather than at plugin startup
+    
+    Returns:
+        The tomllib (or tomli) module, or None if neither is available
+    """
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+    return tomllib
+
+
 class ProfileData(TypedDict):
     """Profile data with current profile tracking"""
     current_profile: str
@@ -86,22 +274,20 @@ class ProfileData(TypedDict):
     global_config: Dict[str, Any]  # Global settings (dll, no_fp16)
 
 
+@lru_cache(maxsize=8)
+def _parse_profiles_cached(content: str) -> ProfileData:
+    """Parse profile TOML once per distinct content string; callers must copy"""
+    return ConfigurationManager._parse_toml_profiles(content)
+
+
 class ConfigurationManager:
     """Centralized configuration management"""
     
     @staticmethod
     def get_defaults() -> ConfigurationData:
         """Get default configuration values"""
-        # Use shared defaults and add script-only fields
-        shared_defaults = get_defaults()
-        
-        # Add script-only fields that aren't in the shared schema
-        script_defaults = {
-            field.name: field.default 
-            for field in SCRIPT_ONLY_FIELDS.values()
-        }
-        
-        return cast(ConfigurationData, {**shared_defaults, **script_defaults})
+        # Copy so callers can mutate their defaults freely
+        return cast(ConfigurationData, dict(_compute_defaults()))
     
     @staticmethod
     def get_defaults_with_dll_detection(dll_detection_service=None) -> ConfigurationData:
@@ -134,39 +320,24 @@ class ConfigurationManager:
     @staticmethod
     def get_field_names() -> list[str]:
         """Get ordered list of configuration field names"""
-        # Use shared field names and add script-only fields
-        shared_names = get_field_names()
-        script_names = list(SCRIPT_ONLY_FIELDS.keys())
-        return shared_names + script_names
+        return list(_compute_field_names())
     
     @staticmethod
     def get_field_types() -> Dict[str, ConfigFieldType]:
         """Get field type mapping"""
-        # Use shared field types and add script-only field types
-        shared_types = {name: ConfigFieldType(type_str) for name, type_str in get_field_types().items()}
-        script_types = {field.name: field.field_type for field in SCRIPT_ONLY_FIELDS.values()}
-        return {**shared_types, **script_types}
+        return dict(_compute_field_types())
     
     @staticmethod
     def validate_config(config: Dict[str, Any]) -> ConfigurationData:
-        """Validate and convert configuration data"""
-        validated = {}
-        
-        for field_name, field_def in COMPLETE_CONFIG_SCHEMA.items():
-            value = config.get(field_name, field_def.default)
-            
-            # Type validation and conversion
-            if field_def.field_type == ConfigFieldType.BOOLEAN:
-                validated[field_name] = bool(value)
-            elif field_def.field_type == ConfigFieldType.INTEGER:
-                validated[field_name] = int(value)
-            elif field_def.field_type == ConfigFieldType.FLOAT:
-                validated[field_name] = float(value)
-            elif field_def.field_type == ConfigFieldType.STRING:
-                validated[field_name] = str(value)
-            else:
-                validated[field_name] = value
+        """Validate and convert configuration data
         
+        Only needed for untrusted input such as dicts coming from the UI;
+        configs returned by the parse_* methods are already typed.
+        """
+        validated = {
+            field_name: convert(config.get(field_name, _FIELD_DEFAULTS[field_name]))
+            for field_name, convert in _FIELD_CONVERTERS.items()
+        }
         return cast(ConfigurationData, validated)
     
     @staticmethod
@@ -186,28 +357,26 @@ class ConfigurationManager:
     @staticmethod
     def generate_toml_content_multi_profile(profile_data: ProfileData) -> str:
         """Generate TOML configuration file content with multiple profiles"""
-        lines = ["version = 1"]
-        lines.append("")
-
-        # Add global section with global fields
-        lines.append("[global]")
-        
-        # Add current_profile field
-        lines.append(f"# Currently selected profile")
-        lines.append(f'current_profile = "{profile_data["current_profile"]}"')
-        lines.append("")
+        buffer = io.StringIO()
+        ConfigurationManager.write_toml(profile_data, buffer)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def write_toml(profile_data: ProfileData, fp: TextIO) -> None:
+        """Write TOML configuration with multiple profiles to a text stream
         
-        # Add dll field if specified
+        Args:
+            profile_data: Profile data to serialize
+            fp: Writable text stream (file object or io.StringIO)
+        """
+        # Global section (dll is only written when specified)
         dll_path = profile_data["global_config"].get("dll", "")
-        if dll_path:
-            lines.append(f"# specify where Lossless.dll is stored")
-            lines.append(f'dll = "{dll_path}"')
-        lines.append("")
-
-        lines.append(f"# FP16 acceleration")
         no_fp16 = bool(profile_data["global_config"].get("no_fp16", False))
-        lines.append(f"no_fp16 = {str(no_fp16).lower()}")
-        lines.append("")
+        fp.write(_GLOBAL_SECTION_TEMPLATE.format(
+            current_profile=_toml_str(profile_data["current_profile"]),
+            dll_block=_DLL_BLOCK_TEMPLATE.format(dll=_toml_str(dll_path)) if dll_path else "",
+            no_fp16=_BOOL_STR[no_fp16]
+        ))
         
         # Add game sections for each profile
         # Sort profiles to ensure consistent order (default profile first)
@@ -215,36 +384,17 @@ class ConfigurationManager:
                                key=lambda x: (x[0] != DEFAULT_PROFILE_NAME, x[0]))
         
         for profile_name, config in sorted_profiles:
-            lines.append("[[game]]")
             if profile_name == DEFAULT_PROFILE_NAME:
-                lines.append("# Plugin-managed game entry (default profile)")
+                comment = "# Plugin-managed game entry (default profile)"
             else:
-                lines.append(f"# Profile: {profile_name}")
-            lines.append(f'exe = "{profile_name}"')
-            lines.append("")
+                comment = f"# Profile: {profile_name}"
+            fp.write("\n")
+            fp.write(_GAME_HEADER_TEMPLATE.format(comment=comment, exe=_toml_str(profile_name)))
             
-            # Add all configuration fields to the game section (excluding global fields)
-            for field_name, field_def in CONFIG_SCHEMA.items():
-                # Skip global fields - they go in global section
-                if field_name in GLOBAL_SECTION_FIELDS:
-                    continue
-                    
-                value = config.get(field_name, field_def.default)
-                
-                # Add field description comment
-                lines.append(f"# {field_def.description}")
-                
-                # Format value based on type
-                if isinstance(value, bool):
-                    lines.append(f"{field_name} = {str(value).lower()}")
-                elif isinstance(value, str) and value:  # Only add non-empty strings
-                    lines.append(f'{field_name} = "{value}"')
-                elif isinstance(value, (int, float)):  # Always include numbers, even if 0 or 1
-                    lines.append(f"{field_name} = {value}")
-                
-                lines.append("")  # Empty line for readability
-        
-        return "\n".join(lines)
+            # Add all configuration fields to the game section (global fields
+            # are excluded from the formatter table)
+            for field_name, default, format_block in _GAME_FIELD_FORMATTERS:
+                fp.write(format_block(config.get(field_name, default)))
     
     @staticmethod
     def parse_toml_content(content: str) -> ConfigurationData:
@@ -264,124 +414,33 @@ class ConfigurationManager:
     
     @staticmethod
     def parse_toml_content_multi_profile(content: str) -> ProfileData:
-        """Parse TOML content into profile data structure"""
-        profiles: Dict[str, ConfigurationData] = {}
-        global_config: Dict[str, Any] = {}
-        current_profile = DEFAULT_PROFILE_NAME
+        """Parse TOML content into profile data structure
         
+        Results are cached by content. The returned structure is a copy, so
+        mutating it does not affect later calls with the same content.
+        """
+        cached = _parse_profiles_cached(content)
+        return ProfileData(
+            current_profile=cached["current_profile"],
+            profiles={name: cast(ConfigurationData, dict(config)) for name, config in cached["profiles"].items()},
+            global_config=dict(cached["global_config"])
+        )
+    
+    @staticmethod
+    def _parse_toml_profiles(content: str) -> ProfileData:
+        """Parse TOML content into profile data structure (uncached)"""
         try:
-            # Look for both [global] and [[game]] sections
-            lines = content.split('\n')
-            in_global_section = False
-            in_game_section = False
-            current_game_exe = None
-            current_game_config: Dict[str, Any] = {}
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Check for section headers
-                if line.startswith('[') and line.endswith(']'):
-                    # Save previous game section if we were in one
-                    if in_game_section and current_game_exe:
-                        # Validate and store the profile config
-                        validated_config = ConfigurationManager.get_defaults()
-                        for key, value in current_game_config.items():
-                            if key in CONFIG_SCHEMA:
-                                field_def = CONFIG_SCHEMA[key]
-                                try:
-                                    if field_def.field_type == ConfigFieldType.BOOLEAN:
-                                        validated_config[key] = value
-                                    elif field_def.field_type == ConfigFieldType.INTEGER:
-                                        validated_config[key] = int(value) if not isinstance(value, int) else value
-                                    elif field_def.field_type == ConfigFieldType.FLOAT:
-                                        validated_config[key] = float(value) if not isinstance(value, float) else value
-                                    elif field_def.field_type == ConfigFieldType.STRING:
-                                        validated_config[key] = str(value)
-                                except (ValueError, TypeError):
-                                    # If conversion fails, keep default value
-                                    pass
-                        profiles[current_game_exe] = validated_config
-                        current_game_config = {}
-                    
-                    # Set new section state
-                    if line == '[global]':
-                        in_global_section = True
-                        in_game_section = False
-                    elif line == '[[game]]':
-                        in_global_section = False
-                        in_game_section = True
-                        current_game_exe = None
-                    else:
-                        in_global_section = False
-                        in_game_section = False
-                    continue
-                
-                # Parse key = value lines
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes from string values
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Handle global section
-                    if in_global_section:
-                        if key == "current_profile":
-                            current_profile = value
-                        elif key == "dll":
-                            global_config["dll"] = value
-                        elif key == "no_fp16":
-                            global_config["no_fp16"] = value.lower() in ('true', '1', 'yes', 'on')
-                    
-                    # Handle game section
-                    elif in_game_section:
-                        # Track the exe for this game section
-                        if key == "exe":
-                            current_game_exe = value
-                        # Store config fields for current game
-                        elif key in CONFIG_SCHEMA:
-                            field_def = CONFIG_SCHEMA[key]
-                            try:
-                                if field_def.field_type == ConfigFieldType.BOOLEAN:
-                                    current_game_config[key] = value.lower() in ('true', '1', 'yes', 'on')
-                                elif field_def.field_type == ConfigFieldType.INTEGER:
-                                    current_game_config[key] = int(value)
-                                elif field_def.field_type == ConfigFieldType.FLOAT:
-                                    current_game_config[key] = float(value)
-                                elif field_def.field_type == ConfigFieldType.STRING:
-                                    current_game_config[key] = value
-                            except (ValueError, TypeError):
-                                # If conversion fails, keep default value
-                                pass
-            
-            # Handle final game section if we were in one
-            if in_game_section and current_game_exe:
-                validated_config = ConfigurationManager.get_defaults()
-                for key, value in current_game_config.items():
-                    if key in CONFIG_SCHEMA:
-                        field_def = CONFIG_SCHEMA[key]
-                        try:
-                            if field_def.field_type == ConfigFieldType.BOOLEAN:
-                                validated_config[key] = value
-                            elif field_def.field_type == ConfigFieldType.INTEGER:
-                                validated_config[key] = int(value) if not isinstance(value, int) else value
-                            elif field_def.field_type == ConfigFieldType.FLOAT:
-                                validated_config[key] = float(value) if not isinstance(value, float) else value
-                            elif field_def.field_type == ConfigFieldType.STRING:
-                                validated_config[key] = str(value)
-                        except (ValueError, TypeError):
-                            # If conversion fails, keep default value
-                            pass
-                profiles[current_game_exe] = validated_config
+            parsed = None
+            toml = _load_tomllib()
+            if toml is not None:
+                try:
+                    parsed = ConfigurationManager._profiles_from_toml(toml.loads(content))
+                except (toml.TOMLDecodeError, AttributeError, TypeError):
+                    # Hand-edited files may not be strict TOML; use the lenient parser
+                    parsed = None
+            if parsed is None:
+                parsed = ConfigurationManager._profiles_from_lines(content)
+            current_profile, profiles, global_config = parsed
             
             # Ensure we have at least the default profile
             if not profiles:
@@ -408,6 +467,121 @@ class ConfigurationManager:
                 global_config={}
             )
     
+    @staticmethod
+    def _toml_text(value: Any) -> str:
+        """Render a parsed TOML value the way the line parser would have read it"""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+    
+    @staticmethod
+    def _profiles_from_toml(data: Dict[str, Any]) -> Tuple[str, Dict[str, ConfigurationData], Dict[str, Any]]:
+        """Extract profiles from a document decoded by tomllib
+        
+        Values are coerced with the same rules as the line parser so both
+        paths produce identical results for the files we generate.
+        """
+        profiles: Dict[str, ConfigurationData] = {}
+        global_config: Dict[str, Any] = {}
+        to_text = ConfigurationManager._toml_text
+        
+        global_section = data.get("global", {})
+        current_profile = to_text(global_section.get("current_profile", DEFAULT_PROFILE_NAME))
+        if "dll" in global_section:
+            global_config["dll"] = to_text(global_section["dll"])
+        if "no_fp16" in global_section:
+            global_config["no_fp16"] = _parse_bool_text(to_text(global_section["no_fp16"]))
+        
+        for game in data.get("game", []):
+            exe = game.get("exe")
+            if not exe:
+                continue
+            config = ConfigurationManager.get_defaults()
+            for key, value in game.items():
+                parse_value = _TOML_VALUE_PARSERS.get(key)
+                if parse_value is None:
+                    continue
+                try:
+                    config[key] = parse_value(to_text(value))
+                except (ValueError, TypeError):
+                    # If conversion fails, keep default value
+                    pass
+            profiles[to_text(exe)] = config
+        
+        return current_profile, profiles, global_config
+    
+    @staticmethod
+    def _profiles_from_lines(content: str) -> Tuple[str, Dict[str, ConfigurationData], Dict[str, Any]]:
+        """Lenient line-based parser for content that is not strict TOML"""
+        profiles: Dict[str, ConfigurationData] = {}
+        global_config: Dict[str, Any] = {}
+        current_profile = DEFAULT_PROFILE_NAME
+        
+        # Look for both [global] and [[game]] sections
+        section_state = _SECTION_NONE
+        current_game_exe = None
+        current_game_config: Dict[str, Any] = {}
+        
+        for match in _LINE_RE.finditer(content):
+            # Check for section headers
+            section = match.group('section')
+            if section is not None:
+                # Save previous game section if we were in one
+                if section_state == _SECTION_GAME and current_game_exe:
+                    # Values were already converted while parsing, so just
+                    # overlay them on the defaults
+                    profiles[current_game_exe] = cast(ConfigurationData, {
+                        **ConfigurationManager.get_defaults(), **current_game_config
+                    })
+                    current_game_config = {}
+                
+                # Set new section state
+                if section == '[global]':
+                    section_state = _SECTION_GLOBAL
+                elif section == '[[game]]':
+                    section_state = _SECTION_GAME
+                    current_game_exe = None
+                else:
+                    section_state = _SECTION_NONE
+                continue
+            
+            # Parse key = value lines; exactly one value alternative
+            # matches, so lastindex selects it
+            key = match.group('key')
+            value = match.group(match.lastindex)
+            
+            # Handle game section
+            if section_state == _SECTION_GAME:
+                # Track the exe for this game section
+                if key == "exe":
+                    current_game_exe = value
+                # Store config fields for current game
+                else:
+                    parse_value = _TOML_VALUE_PARSERS.get(key)
+                    if parse_value is not None:
+                        try:
+                            current_game_config[key] = parse_value(value)
+                        except (ValueError, TypeError):
+                            # If conversion fails, keep default value
+                            pass
+            
+            # Handle global section
+            elif section_state == _SECTION_GLOBAL:
+                if key == "current_profile":
+                    current_profile = value
+                elif key == "dll":
+                    global_config["dll"] = value
+                elif key == "no_fp16":
+                    global_config["no_fp16"] = _parse_bool_text(value)
+        
+        # Handle final game section if we were in one
+        if section_state == _SECTION_GAME and current_game_exe:
+            profiles[current_game_exe] = cast(ConfigurationData, {
+                **ConfigurationManager.get_defaults(), **current_game_config
+            })
+        
+        return current_profile, profiles, global_config
+    
     @staticmethod
     def parse_script_content(script_content: str) -> Dict[str, Union[bool, int, str]]:
         """Parse launch script content to extract environment variable values
@@ -420,7 +594,7 @@ class ConfigurationManager:
         """
         # Use auto-generated parsing logic
         parse_script_values = get_script_parsing_logic()
-        return parse_script_values(script_content.split('\n'))
+        return parse_script_values(script_content)
     
     @staticmethod
     def merge_config_with_script(toml_config: ConfigurationData, script_values: Dict[str, Union[bool, int, str]]) -> ConfigurationData:
@@ -436,7 +610,7 @@ class ConfigurationManager:
         merged_config = dict(toml_config)
         
         # Update script-only fields with values from script
-        for field_name in SCRIPT_ONLY_FIELDS.keys():
+        for field_name in _SCRIPT_ONLY_KEYS:
             if field_name in script_values:
                 merged_config[field_name] = script_values[field_name]
         
@@ -2,9 +2,11 @@
 Auto-generated configuration schema components from shared_config.py
 DO NOT EDIT THIS FILE MANUALLY - it will be overwritten on build
 """
+# schema-hash: f917ce7423ee23a32f95e03a2e2a22f3
 
 from typing import TypedDict, Dict, Any, Union
 from enum import Enum
+import re
 import sys
 from pathlib import Path
 
@@ -49,46 +51,58 @@ class ConfigurationData(TypedDict):
     enable_zink: bool
 
 
+# Matches uncommented "export KEY=VALUE" lines in the launch script
+_EXPORT_RE = re.compile(r"^[ \t]*export[ \t]+([^=\n]*)=(.*)$", re.MULTILINE)
+
+
+def _equals(expected):
+    """Converter: True when the value equals expected"""
+    return lambda value: value == expected
+
+
+def _not_equals(expected):
+    """Converter: True unless the value equals expected"""
+    return lambda value: value != expected
+
+
+def _only_if(expected):
+    """Converter: True when the value equals expected, otherwise leave the field unset"""
+    def convert(value):
+        if value != expected:
+            raise ValueError(value)
+        return True
+    return convert
+
+
+# Auto-generated env var -> (field name, converter) dispatch table
+_SCRIPT_PARSERS = {
+    "DXVK_FRAME_RATE": ("dxvk_frame_rate", int),
+    "PROTON_USE_WOW64": ("enable_wow64", _equals("1")),
+    "SteamDeck": ("disable_steamdeck_mode", _equals("0")),
+    "MANGOHUD": ("mangohud_workaround", _equals("1")),
+    "DISABLE_VKBASALT": ("disable_vkbasalt", _equals("1")),
+    "ENABLE_VKBASALT": ("force_enable_vkbasalt", _equals("1")),
+    "ENABLE_GAMESCOPE_WSI": ("enable_wsi", _not_equals("0")),
+    "DXVK_HDR": ("enable_wsi", _not_equals("0")),
+    "__GLX_VENDOR_LIBRARY_NAME": ("enable_zink", _only_if("mesa")),
+    "MESA_LOADER_DRIVER_OVERRIDE": ("enable_zink", _only_if("zink")),
+    "GALLIUM_DRIVER": ("enable_zink", _only_if("zink")),
+}
+
+
 def get_script_parsing_logic():
     """Return the script parsing logic as a callable"""
-    def parse_script_values(lines):
+    def parse_script_values(content):
         script_values = {}
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#") or not line.startswith("export "):
+        for match in _EXPORT_RE.finditer(content):
+            parser = _SCRIPT_PARSERS.get(match.group(1).strip())
+            if parser is None:
                 continue
-            if "=" in line:
-                export_line = line[len("export "):]
-                key, value = export_line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Auto-generated parsing logic:
-                if key == "DXVK_FRAME_RATE":
-                        try:
-                            script_values["dxvk_frame_rate"] = int(value)
-                        except ValueError:
-                            pass
-                if key == "PROTON_USE_WOW64":
-                        script_values["enable_wow64"] = value == "1"
-                if key == "SteamDeck":
-                        script_values["disable_steamdeck_mode"] = value == "0"
-                if key == "MANGOHUD":
-                        script_values["mangohud_workaround"] = value == "1"
-                if key == "DISABLE_VKBASALT":
-                        script_values["disable_vkbasalt"] = value == "1"
-                if key == "ENABLE_VKBASALT":
-                        script_values["force_enable_vkbasalt"] = value == "1"
-                if key == "ENABLE_GAMESCOPE_WSI":
-                        script_values["enable_wsi"] = value != "0"
-                if key == "DXVK_HDR":
-                        script_values["enable_wsi"] = value != "0"
-                if key == "__GLX_VENDOR_LIBRARY_NAME" and value == "mesa":
-                        script_values["enable_zink"] = True
-                if key == "MESA_LOADER_DRIVER_OVERRIDE" and value == "zink":
-                        script_values["enable_zink"] = True
-                if key == "GALLIUM_DRIVER" and value == "zink":
-                        script_values["enable_zink"] = True
+            field_name, convert = parser
+            try:
+                script_values[field_name] = convert(match.group(2).strip())
+            except ValueError:
+                pass
 
         return script_values
     return parse_script_values
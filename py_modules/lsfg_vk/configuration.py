@@ -2,27 +2,60 @@
 Configuration service for TOML-based lsfg configuration management.
 """
 
-from pathlib import Path
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from .base_service import BaseService
-from .config_schema import ConfigurationManager, CONFIG_SCHEMA, ProfileData, DEFAULT_PROFILE_NAME
+from .config_schema import ConfigurationManager, ProfileData, DEFAULT_PROFILE_NAME
 from .config_schema_generated import ConfigurationData, get_script_generation_logic
 from .constants import ARMADA_DEVICE_ENV, ARMADA_GAME_LAUNCH
 from .types import ConfigurationResponse, ProfilesResponse, ProfileResponse
 
+_DEFAULT_SCRIPT_HEADER = (
+    "# lsfg-vk launch script generated by decky-lossless-scaling-vk plugin\n"
+    "# This script sets up the environment for lsfg-vk to work with the plugin configuration"
+)
+_DEFAULT_PROCESS_NAME = "decky-lsfg-vk"
+
+# Portable exec block that hands off to Armada's host wrapper when present
+_GAME_LAUNCH_BLOCK = "\n".join([
+    f'armada_game_launch="{ARMADA_GAME_LAUNCH.as_posix()}"',
+    'for argument in "$@"; do',
+    '    if [ "$argument" = "$armada_game_launch" ]; then',
+    '        exec "$@"',
+    "    fi",
+    "done",
+    f'if [ -f "{ARMADA_DEVICE_ENV.as_posix()}" ] && [ -x "$armada_game_launch" ]; then',
+    '    exec "$armada_game_launch" "$@"',
+    "fi",
+    'exec "$@"',
+]) + "\n"
+
 
 class ConfigurationService(BaseService):
     """Service for managing TOML-based lsfg configuration"""
     
+    def __init__(self, logger=None):
+        super().__init__(logger)
+        
+        # ((config, script) file signatures, merged config) of the last parsed config file
+        self._config_cache: Optional[Tuple[Tuple[Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]]], ConfigurationData]] = None
+    
     def get_config(self) -> ConfigurationResponse:
         """Read current TOML configuration merged with launch script environment variables
         
+        The parsed result is reused while neither file's mtime, inode or size changes.
+        
         Returns:
             ConfigurationResponse with current configuration or error
         """
         try:
-            if not self.config_file_path.exists():
+            cache_key = (self._get_file_signature(self.config_file_path), self._get_file_signature(self.lsfg_script_path))
+            cached = self._config_cache
+            if cached and cached[0] == cache_key:
+                return self._success_response(ConfigurationResponse, config=dict(cached[1]))
+            
+            if cache_key[0] is None:
                 from .dll_detection import DllDetectionService
                 dll_service = DllDetectionService(self.log)
                 toml_config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
@@ -31,7 +64,7 @@ class ConfigurationService(BaseService):
                 toml_config = ConfigurationManager.parse_toml_content(content)
             
             script_values = {}
-            if self.lsfg_script_path.exists():
+            if cache_key[1] is not None:
                 try:
                     script_content = self.lsfg_script_path.read_text(encoding='utf-8')
                     script_values = ConfigurationManager.parse_script_content(script_content)
@@ -41,6 +74,10 @@ class ConfigurationService(BaseService):
             
             config = ConfigurationManager.merge_config_with_script(toml_config, script_values)
             
+            # Defaults depend on DLL detection rather than on files, so only cache real configs
+            if cache_key[0] is not None:
+                self._config_cache = (cache_key, dict(config))
+            
             return self._success_response(ConfigurationResponse, config=config)
             
         except (OSError, IOError) as e:
@@ -93,7 +130,8 @@ class ConfigurationService(BaseService):
         try:
             script_content = self._generate_script_content(config)
             
-            self._write_file(self.lsfg_script_path, script_content, 0o755)
+            self._config_cache = None
+            self._atomic_write(self.lsfg_script_path, script_content, 0o755)
             
             self.log.info(f"Updated lsfg launch script at {self.lsfg_script_path}")
             
@@ -115,19 +153,7 @@ class ConfigurationService(BaseService):
         Returns:
             The complete script content as a string
         """
-        lines = [
-            "#!/bin/bash",
-            "# lsfg-vk launch script generated by decky-lossless-scaling-vk plugin",
-            "# This script sets up the environment for lsfg-vk to work with the plugin configuration",
-        ]
-        
-        generate_script_lines = get_script_generation_logic()
-        lines.extend(generate_script_lines(config))
-        
-        lines.append("export LSFG_PROCESS=decky-lsfg-vk")
-        lines.extend(self._generate_game_launch_lines())
-        
-        return "\n".join(lines) + "\n"
+        return self._render_script(_DEFAULT_SCRIPT_HEADER, config, _DEFAULT_PROCESS_NAME)
     
     def _generate_script_content_for_profile(self, profile_data: ProfileData) -> str:
         """Generate the content for the ~/lsfg launch script with profile support
@@ -142,39 +168,29 @@ class ConfigurationService(BaseService):
         config = profile_data["profiles"].get(current_profile, ConfigurationManager.get_defaults())
         
         merged_config = dict(config)
-        for field_name, value in profile_data["global_config"].items():
-            merged_config[field_name] = value
-        
-        lines = [
-            "#!/bin/bash",
-            f"# Current profile: {current_profile}",
-        ]
+        merged_config.update(profile_data["global_config"])
         
-        generate_script_lines = get_script_generation_logic()
-        lines.extend(generate_script_lines(merged_config))
-        
-        lines.append(f"export LSFG_PROCESS={current_profile}")
-        lines.extend(self._generate_game_launch_lines())
-        
-        return "\n".join(lines) + "\n"
+        return self._render_script(f"# Current profile: {current_profile}", merged_config, current_profile)
 
     @staticmethod
-    def _generate_game_launch_lines() -> list[str]:
-        """Generate a portable exec block with Armada's host wrapper."""
-        device_env = ARMADA_DEVICE_ENV.as_posix()
-        game_launch = ARMADA_GAME_LAUNCH.as_posix()
-        return [
-            f'armada_game_launch="{game_launch}"',
-            'for argument in "$@"; do',
-            '    if [ "$argument" = "$armada_game_launch" ]; then',
-            '        exec "$@"',
-            "    fi",
-            "done",
-            f'if [ -f "{device_env}" ] && [ -x "$armada_game_launch" ]; then',
-            '    exec "$armada_game_launch" "$@"',
-            "fi",
-            'exec "$@"',
-        ]
+    def _render_script(header: str, config: ConfigurationData, process_name: str) -> str:
+        """Render the launch script from its header, exports and exec block
+        
+        Args:
+            header: Comment line(s) placed after the shebang
+            config: Configuration the export lines are generated from
+            process_name: Value exported as LSFG_PROCESS
+            
+        Returns:
+            The complete script content as a string
+        """
+        exports = "\n".join(get_script_generation_logic()(config))
+        if exports:
+            exports += "\n"
+        return (
+            f"#!/bin/bash\n{header}\n{exports}"
+            f"export LSFG_PROCESS={process_name}\n{_GAME_LAUNCH_BLOCK}"
+        )
     
     def _get_profile_data(self) -> ProfileData:
         """Get current profile data from config file"""
@@ -196,11 +212,12 @@ class ConfigurationService(BaseService):
     
     def _save_profile_data(self, profile_data: ProfileData) -> None:
         """Save profile data to config file"""
+        self._config_cache = None
         toml_content = ConfigurationManager.generate_toml_content_multi_profile(profile_data)
         
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        self._write_file(self.config_file_path, toml_content, 0o644)
+        self._atomic_write(self.config_file_path, toml_content, 0o644, durable=True)
     
     def get_profiles(self) -> ProfilesResponse:
         """Get list of all profiles and current profile
@@ -428,8 +445,9 @@ class ConfigurationService(BaseService):
         try:
             script_content = self._generate_script_content_for_profile(profile_data)
             
+            self._config_cache = None
             # Write the script file
-            self._write_file(self.lsfg_script_path, script_content, 0o755)
+            self._atomic_write(self.lsfg_script_path, script_content, 0o755)
             
             self.log.info(f"Updated lsfg launch script at {self.lsfg_script_path} for profile '{profile_data['current_profile']}'")
             
@@ -444,3 +462,15 @@ class ConfigurationService(BaseService):
             error_msg = f"Error updating launch script: {str(e)}"
             self.log.error(error_msg)
             return self._error_response(ConfigurationResponse, str(e), config=None)
+
+
+@lru_cache(maxsize=1)
+def get_default_script_content() -> str:
+    """Launch script content for the default configuration, rendered once
+    
+    Returns:
+        The complete script content as a string
+    """
+    return ConfigurationService._render_script(
+        _DEFAULT_SCRIPT_HEADER, ConfigurationManager.get_defaults(), _DEFAULT_PROCESS_NAME
+    )
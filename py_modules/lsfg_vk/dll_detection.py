@@ -4,8 +4,9 @@ DLL detection service for Lossless Scaling.
 
 import os
 import re
+import time
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .base_service import BaseService
 from .constants import (
@@ -15,9 +16,47 @@ from .constants import (
 from .types import DllDetectionResponse
 
 
+def _xdg_steam_root(base: Path) -> Path:
+    """Steam root under an XDG_DATA_HOME directory"""
+    return base / "Steam"
+
+
+def _home_steam_root(base: Path) -> Path:
+    """Steam root under a HOME directory"""
+    return base / ".local" / "share" / "Steam"
+
+
+# (environment variable, env value -> Steam root), in search order
+_STEAM_ROOTS: Tuple[Tuple[str, Callable[[Path], Path]], ...] = (
+    (ENV_XDG_DATA_HOME, _xdg_steam_root),
+    (ENV_HOME, _home_steam_root),
+)
+
+# (environment variable, source label, env value -> candidate DLL path), in search order
+_ENV_CANDIDATES: Tuple[Tuple[str, str, Callable[[Path], Path]], ...] = (
+    (ENV_LSFG_DLL_PATH, f"{ENV_LSFG_DLL_PATH} environment variable",
+     lambda base: base),
+    (ENV_XDG_DATA_HOME, f"{ENV_XDG_DATA_HOME} Steam directory",
+     lambda base: _xdg_steam_root(base) / STEAM_COMMON_PATH / LOSSLESS_DLL_NAME),
+    (ENV_HOME, f"{ENV_HOME}/.local/share Steam directory",
+     lambda base: _home_steam_root(base) / STEAM_COMMON_PATH / LOSSLESS_DLL_NAME),
+)
+
+_ENV_VARS = (ENV_LSFG_DLL_PATH, ENV_XDG_DATA_HOME, ENV_HOME)
+
+# How long a "not found" result is reused before the filesystem is searched again
+DLL_NOT_FOUND_TTL = 30.0
+
+
 class DllDetectionService(BaseService):
     """Service for detecting Lossless Scaling DLL"""
     
+    def __init__(self, logger=None):
+        super().__init__(logger)
+        
+        # (env values, result, timestamp) of the last check
+        self._dll_cache: Optional[Tuple[Tuple[str, ...], DllDetectionResponse, float]] = None
+    
     def check_lossless_scaling_dll(self) -> DllDetectionResponse:
         """Check if Lossless Scaling DLL is available at the expected paths
         
@@ -27,33 +66,36 @@ class DllDetectionService(BaseService):
         3. HOME/.local/share Steam directory  
         4. All Steam library folders (including SD cards)
         
+        Results are cached per set of relevant environment values: a detected
+        path is reused while it still exists, and a miss is reused for
+        DLL_NOT_FOUND_TTL seconds.
+        
         Returns:
             DllDetectionResponse with detection status and path information
         """
         try:
-            dll_path = self._check_env_dll_path()
-            if dll_path:
-                return dll_path
-            
-            xdg_path = self._check_xdg_data_home()
-            if xdg_path:
-                return xdg_path
-            
-            home_path = self._check_home_local_share()
-            if home_path:
-                return home_path
+            env = {env_var: (os.environ.get(env_var) or "").strip() for env_var in _ENV_VARS}
+            env_key = tuple(env.values())
+            now = time.monotonic()
             
-            steam_libraries_path = self._check_steam_library_folders()
-            if steam_libraries_path:
-                return steam_libraries_path
+            cached = self._dll_cache
+            if cached and cached[0] == env_key:
+                cached_result = cached[1]
+                if cached_result["detected"]:
+                    if self._path_exists(cached_result["path"]):
+                        return dict(cached_result)
+                elif now - cached[2] < DLL_NOT_FOUND_TTL:
+                    return dict(cached_result)
             
-            return {
+            result = self._check_env_candidates(env) or self._check_steam_library_folders(env) or {
                 "detected": False,
                 "path": None,
                 "source": None,
                 "message": "Lossless Scaling DLL not found in expected locations",
                 "error": None
             }
+            self._dll_cache = (env_key, result, now)
+            return dict(result)
             
         except Exception as e:
             error_msg = f"Error checking Lossless Scaling DLL: {str(e)}"
@@ -66,108 +108,86 @@ class DllDetectionService(BaseService):
                 "error": str(e)
             }
     
-    def _check_env_dll_path(self) -> DllDetectionResponse | None:
-        """Check LSFG_DLL_PATH environment variable
-        
-        Returns:
-            DllDetectionResponse if found, None otherwise
-        """
-        dll_path = os.getenv(ENV_LSFG_DLL_PATH)
-        if dll_path and dll_path.strip():
-            dll_path_obj = Path(dll_path.strip())
-            if dll_path_obj.exists():
-                self.log.info(f"Found DLL via {ENV_LSFG_DLL_PATH}: {dll_path_obj}")
-                return {
-                    "detected": True,
-                    "path": str(dll_path_obj),
-                    "source": f"{ENV_LSFG_DLL_PATH} environment variable",
-                    "message": None,
-                    "error": None
-                }
-        return None
+    def clear_cache(self) -> None:
+        """Forget the last detection result, e.g. after an install or uninstall"""
+        self._dll_cache = None
     
-    def _check_xdg_data_home(self) -> DllDetectionResponse | None:
-        """Check XDG_DATA_HOME Steam directory
-        
-        Returns:
-            DllDetectionResponse if found, None otherwise
-        """
-        data_dir = os.getenv(ENV_XDG_DATA_HOME)
-        if data_dir and data_dir.strip():
-            dll_path = Path(data_dir.strip()) / "Steam" / STEAM_COMMON_PATH / LOSSLESS_DLL_NAME
-            if dll_path.exists():
-                self.log.info(f"Found DLL via {ENV_XDG_DATA_HOME}: {dll_path}")
-                return {
-                    "detected": True,
-                    "path": str(dll_path),
-                    "source": f"{ENV_XDG_DATA_HOME} Steam directory",
-                    "message": None,
-                    "error": None
-                }
-        return None
+    @staticmethod
+    def _path_exists(path: Path | str) -> bool:
+        """Check that a candidate path exists; any stat error counts as missing"""
+        try:
+            os.stat(path)
+        except OSError:
+            return False
+        return True
+    
+    @staticmethod
+    def _found_response(dll_path: Path, source: str) -> DllDetectionResponse:
+        """Build the response for a detected DLL"""
+        return {
+            "detected": True,
+            "path": str(dll_path),
+            "source": source,
+            "message": None,
+            "error": None
+        }
     
-    def _check_home_local_share(self) -> DllDetectionResponse | None:
-        """Check HOME/.local/share Steam directory
+    def _check_env_candidates(self, env: Dict[str, str]) -> DllDetectionResponse | None:
+        """Check the environment-derived DLL locations in search order
         
+        Args:
+            env: Stripped values of the relevant environment variables
+            
         Returns:
-            DllDetectionResponse if found, None otherwise
+            DllDetectionResponse for the first existing candidate, None otherwise
         """
-        home_dir = os.getenv(ENV_HOME)
-        if home_dir and home_dir.strip():
-            dll_path = Path(home_dir.strip()) / ".local" / "share" / "Steam" / STEAM_COMMON_PATH / LOSSLESS_DLL_NAME
-            if dll_path.exists():
-                self.log.info(f"Found DLL via {ENV_HOME}/.local/share: {dll_path}")
-                return {
-                    "detected": True,
-                    "path": str(dll_path),
-                    "source": f"{ENV_HOME}/.local/share Steam directory",
-                    "message": None,
-                    "error": None
-                }
+        for env_var, source, build_path in _ENV_CANDIDATES:
+            env_value = env[env_var]
+            if not env_value:
+                continue
+            
+            dll_path = build_path(Path(env_value))
+            if not self._path_exists(dll_path):
+                continue
+            
+            self.log.info(f"Found DLL via {source}: {dll_path}")
+            return self._found_response(dll_path, source)
         return None
 
-    def _check_steam_library_folders(self) -> DllDetectionResponse | None:
+    def _check_steam_library_folders(self, env: Dict[str, str]) -> DllDetectionResponse | None:
         """Check all Steam library folders for Lossless Scaling DLL
         
         This method parses Steam's libraryfolders.vdf file to find all
         Steam library locations and checks each one for the DLL.
         
+        Args:
+            env: Stripped values of the relevant environment variables
+            
         Returns:
             DllDetectionResponse if found, None otherwise
         """
-        steam_libraries = self._get_steam_library_paths()
+        steam_libraries = self._get_steam_library_paths(env)
         
         for library_path in steam_libraries:
             dll_path = Path(library_path) / STEAM_COMMON_PATH / LOSSLESS_DLL_NAME
             if dll_path.exists():
                 self.log.info(f"Found DLL in Steam library: {dll_path}")
-                return {
-                    "detected": True,
-                    "path": str(dll_path),
-                    "source": f"Steam library folder: {library_path}",
-                    "message": None,
-                    "error": None
-                }
+                return self._found_response(dll_path, f"Steam library folder: {library_path}")
         
         return None
     
-    def _get_steam_library_paths(self) -> List[str]:
+    def _get_steam_library_paths(self, env: Dict[str, str]) -> List[str]:
         """Get all Steam library folder paths from libraryfolders.vdf
         
+        Args:
+            env: Stripped values of the relevant environment variables
+            
         Returns:
             List of Steam library folder paths
         """
         library_paths = []
         
-        steam_paths = []
-        
-        data_dir = os.getenv(ENV_XDG_DATA_HOME)
-        if data_dir and data_dir.strip():
-            steam_paths.append(Path(data_dir.strip()) / "Steam")
-        
-        home_dir = os.getenv(ENV_HOME)
-        if home_dir and home_dir.strip():
-            steam_paths.append(Path(home_dir.strip()) / ".local" / "share" / "Steam")
+        steam_paths = [build_root(Path(env[env_var])) for env_var, build_root in _STEAM_ROOTS if env[env_var]]
         
         for steam_path in steam_paths:
             if steam_path.exists():
@@ -4,12 +4,12 @@ Flatpak service for managing lsfg-vk Flatpak runtime extensions.
 
 import subprocess
 import os
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 
 from .base_service import BaseService
 from .constants import (
-    FLATPAK_23_08_FILENAME, FLATPAK_24_08_FILENAME, FLATPAK_25_08_FILENAME, BIN_DIR, CONFIG_DIR
+    FLATPAK_23_08_FILENAME, FLATPAK_24_08_FILENAME, FLATPAK_25_08_FILENAME,
+    STEAM_COMMON_PATH, LOSSLESS_DLL_NAME
 )
 from .types import BaseResponse
 
@@ -51,6 +51,11 @@ class FlatpakService(BaseService):
         self.extension_id_24_08 = "org.freedesktop.Platform.VulkanLayer.lsfgvk/x86_64/24.08"
         self.extension_id_25_08 = "org.freedesktop.Platform.VulkanLayer.lsfgvk/x86_64/25.08"
         self.flatpak_command = None
+        
+        # Host paths exposed to Flatpak apps through overrides
+        self.override_config_path = str(self.config_dir)
+        self.override_dll_path = str(self.user_home / ".local" / "share" / "Steam" / STEAM_COMMON_PATH / LOSSLESS_DLL_NAME)
+        self.override_lsfg_path = str(self.lsfg_script_path)
 
     def _get_clean_env(self):
         """Get a clean environment without PyInstaller's bundled libraries"""
@@ -136,7 +141,7 @@ class FlatpakService(BaseService):
             installed_24_08 = False
             installed_25_08 = False
 
-            for line in installed_runtimes.split('\n'):
+            for line in installed_runtimes.splitlines():
                 if base_extension_name in line:
                     if "23.08" in line:
                         installed_23_08 = True
@@ -177,14 +182,13 @@ class FlatpakService(BaseService):
             if not self.check_flatpak_available():
                 return self._error_response(BaseResponse, "Flatpak is not available on this system")
 
-            plugin_dir = Path(__file__).parent.parent.parent
             if version == "23.08":
                 filename = FLATPAK_23_08_FILENAME
             elif version == "24.08":
                 filename = FLATPAK_24_08_FILENAME
             else:
                 filename = FLATPAK_25_08_FILENAME
-            flatpak_path = plugin_dir / BIN_DIR / filename
+            flatpak_path = self.plugin_bin_dir / filename
 
             if not flatpak_path.exists():
                 return self._error_response(BaseResponse, f"Flatpak file not found: {flatpak_path}")
@@ -258,7 +262,7 @@ class FlatpakService(BaseService):
             )
 
             apps = []
-            for line in result.stdout.strip().split('\n'):
+            for line in result.stdout.strip().splitlines():
                 if not line.strip():
                     continue
 
@@ -298,15 +302,14 @@ class FlatpakService(BaseService):
                 return {"filesystem": False, "env": False}
 
             output = result.stdout
-            home_path = os.path.expanduser("~")
-            config_path = f"{home_path}/.config/lsfg-vk"
-            dll_path = f"{home_path}/.local/share/Steam/steamapps/common/Lossless Scaling/Lossless.dll"
-            lsfg_path = f"{home_path}/lsfg"
+            config_path = self.override_config_path
+            dll_path = self.override_dll_path
+            lsfg_path = self.override_lsfg_path
 
             filesystem_section = ""
             in_context = False
             
-            for line in output.split('\n'):
+            for line in output.splitlines():
                 line = line.strip()
                 if line == "[Context]":
                     in_context = True
@@ -325,7 +328,7 @@ class FlatpakService(BaseService):
             env_override = False
             in_environment = False
             
-            for line in output.split('\n'):
+            for line in output.splitlines():
                 line = line.strip()
                 if line == "[Environment]":
                     in_environment = True
@@ -351,10 +354,9 @@ class FlatpakService(BaseService):
                                           "Flatpak is not available on this system",
                                           app_id=app_id, operation="set")
 
-            home_path = os.path.expanduser("~")
-            config_path = f"{home_path}/.config/lsfg-vk"
-            dll_path = f"{home_path}/.local/share/Steam/steamapps/common/Lossless Scaling/Lossless.dll"
-            lsfg_path = f"{home_path}/lsfg"
+            config_path = self.override_config_path
+            dll_path = self.override_dll_path
+            lsfg_path = self.override_lsfg_path
 
             filesystem_overrides = [
                 f"--filesystem={dll_path}",
@@ -401,10 +403,9 @@ class FlatpakService(BaseService):
                                           "Flatpak is not available on this system",
                                           app_id=app_id, operation="remove")
 
-            home_path = os.path.expanduser("~")
-            config_path = f"{home_path}/.config/lsfg-vk"
-            dll_path = f"{home_path}/.local/share/Steam/steamapps/common/Lossless Scaling/Lossless.dll"
-            lsfg_path = f"{home_path}/lsfg"
+            config_path = self.override_config_path
+            dll_path = self.override_dll_path
+            lsfg_path = self.override_lsfg_path
 
             reset_result = self._run_flatpak_command(
                 ["override", "--user", "--reset", app_id],
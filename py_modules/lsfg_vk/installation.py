@@ -5,21 +5,21 @@ Installation service for lsfg-vk.
 import os
 import platform
 import shutil
-import traceback
 import zipfile
-import tempfile
 import json
-from pathlib import Path
-from typing import Dict, Any
+from pathlib import Path, PurePosixPath
 
 from .base_service import BaseService
 from .constants import (
-    LIB_FILENAME, JSON_FILENAME, ZIP_FILENAME, BIN_DIR,
+    LIB_FILENAME, JSON_FILENAME, ZIP_FILENAME,
     SO_EXT, JSON_EXT, ARM_LIB_FILENAME, ARMADA_DEVICE_ENV
 )
 from .config_schema import ConfigurationManager
 from .types import InstallationResponse, UninstallationResponse, InstallationCheckResponse
 
+# Buffer size used when streaming archive members to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 class InstallationService(BaseService):
     """Service for handling lsfg-vk installation and uninstallation"""
@@ -34,11 +34,11 @@ class InstallationService(BaseService):
         """Install lsfg-vk by extracting the zip file to ~/.local
         
         Returns:
-            InstallationResponse with success status and message/error
+            InstallationResponse with success status and message/error, plus the
+            installation check fields on success
         """
         try:
-            plugin_dir = Path(__file__).parent.parent.parent
-            zip_path = plugin_dir / BIN_DIR / ZIP_FILENAME
+            zip_path = self.plugin_bin_dir / ZIP_FILENAME
             
             if not zip_path.exists():
                 error_msg = f"{ZIP_FILENAME} not found at {zip_path}"
@@ -52,16 +52,25 @@ class InstallationService(BaseService):
             # If on ARM, overwrite the .so with the ARM version
             if self._is_arm_architecture():
                 self.log.info("Detected ARM architecture, using ARM binary")
-                arm_so_path = plugin_dir / BIN_DIR / ARM_LIB_FILENAME
+                arm_so_path = self.plugin_bin_dir / ARM_LIB_FILENAME
                 self._copy_plugin_file(arm_so_path, self.lib_file)
-                self.log.info(f"Overwrote with ARM binary: {self.lib_file}")
+                self.log.info("Overwrote with ARM binary: %s", self.lib_file)
 
             self._create_config_file()
             
             self._create_lsfg_launch_script()
             
+            # Verify the layer actually landed before reporting success
+            status = self.check_installation()
+            status.pop("error", None)
+            if not status["installed"]:
+                error_msg = (f"lsfg-vk files missing after installation "
+                             f"(lib={status['lib_exists']}, json={status['json_exists']})")
+                self.log.error(error_msg)
+                return self._error_response(InstallationResponse, error_msg, message="")
+            
             self.log.info("lsfg-vk installed successfully")
-            return self._success_response(InstallationResponse, "lsfg-vk installed successfully")
+            return self._success_response(InstallationResponse, "lsfg-vk installed successfully", **status)
             
         except (OSError, zipfile.BadZipFile, shutil.Error) as e:
             error_msg = f"Error installing lsfg-vk: {str(e)}"
@@ -69,7 +78,7 @@ class InstallationService(BaseService):
             return self._error_response(InstallationResponse, str(e), message="")
         except Exception as e:
             error_msg = f"Unexpected error installing lsfg-vk: {str(e)}"
-            self.log.error(error_msg)
+            self.log.exception(error_msg)
             return self._error_response(InstallationResponse, str(e), message="")
     
     def _is_arm_architecture(self) -> bool:
@@ -98,7 +107,7 @@ class InstallationService(BaseService):
                     self.log.info("Detected native AArch64 host through PID 1")
                     return True
         except OSError as e:
-            self.log.debug(f"Could not inspect native host architecture: {e}")
+            self.log.debug("Could not inspect native host architecture: %s", e)
 
         return False
 
@@ -109,7 +118,7 @@ class InstallationService(BaseService):
         dst_file.chmod(0o644)
 
     def _extract_and_install_files(self, zip_path: Path) -> None:
-        """Extract zip file and install files to appropriate locations
+        """Stream the relevant zip members straight to their install locations
         
         Args:
             zip_path: Path to the zip file to extract
@@ -125,57 +134,86 @@ class InstallationService(BaseService):
         }
         
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                zip_ref.extractall(temp_path)
+            # Pick out the members we install, routed by suffix
+            members = []
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
+                
+                # Zip member names always use forward slashes
+                member_path = PurePosixPath(info.filename)
+                
+                # Check if we know where this file type should go
+                dst_dir = dest_map.get(member_path.suffix)
+                if not dst_dir:
+                    continue
+                
+                if info.file_size == 0:
+                    self.log.warning("Skipping empty archive member %s", info.filename)
+                    continue
+                
+                members.append((info, member_path.name, dst_dir / member_path.name))
+            
+            # One copy buffer shared by every streamed member, no larger than needed
+            buf = bytearray(min(COPY_BUFFER_SIZE, max((info.file_size for info, _, _ in members), default=0)))
+            view = memoryview(buf)
+            
+            for info, file_name, dst_file in members:
+                # Special handling for JSON files - need to modify library_path
+                if file_name == JSON_FILENAME:
+                    self._write_fixed_json_file(zip_ref.read(info), dst_file)
+                else:
+                    with zip_ref.open(info) as src, open(dst_file, 'wb') as dst:
+                        self._preallocate(dst.fileno(), info.file_size)
+                        while n := src.readinto(buf):
+                            dst.write(view[:n])
+                    dst_file.chmod(0o644)
                 
-                # Process extracted files
-                for root, dirs, files in os.walk(temp_path):
-                    root_path = Path(root)
-                    for file in files:
-                        src_file = root_path / file
-                        file_path = Path(file)
-                        
-                        # Check if we know where this file type should go
-                        dst_dir = dest_map.get(file_path.suffix)
-                        if dst_dir:
-                            dst_file = dst_dir / file
-                            
-                            # Special handling for JSON files - need to modify library_path
-                            if file_path.suffix == JSON_EXT and file == JSON_FILENAME:
-                                self._copy_and_fix_json_file(src_file, dst_file)
-                            else:
-                                self._copy_plugin_file(src_file, dst_file)
-                            
-                            self.log.info(f"Copied {file} to {dst_file}")
+                self.log.info("Extracted %s to %s", file_name, dst_file)
     
-    def _copy_and_fix_json_file(self, src_file: Path, dst_file: Path) -> None:
-        """Copy JSON file and fix the library_path to use relative path
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        """Reserve disk space for a file about to be written, where supported
+        
+        Args:
+            fd: Open file descriptor of the destination
+            size: Expected final size in bytes
+        """
+        if size <= 0 or not hasattr(os, "posix_fallocate"):
+            return
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # Not supported by every filesystem; the write extends the file anyway
+            pass
+    
+    def _write_fixed_json_file(self, raw_json: bytes, dst_file: Path) -> None:
+        """Write the layer JSON file with library_path fixed to use a relative path
         
         Args:
-            src_file: Source JSON file path
+            raw_json: Raw JSON content from the archive
             dst_file: Destination JSON file path
         """
         try:
-            # Read the JSON file
-            with open(src_file, 'r') as f:
-                json_data = json.load(f)
+            json_data = json.loads(raw_json)
             
             # Fix the library_path from "liblsfg-vk.so" to "../../../lib/liblsfg-vk.so"
             if 'layer' in json_data and 'library_path' in json_data['layer']:
                 current_path = json_data['layer']['library_path']
                 if current_path == "liblsfg-vk.so":
                     json_data['layer']['library_path'] = "../../../lib/liblsfg-vk.so"
-                    self.log.info(f"Fixed library_path from '{current_path}' to '../../../lib/liblsfg-vk.so'")
+                    self.log.info("Fixed library_path from '%s' to '../../../lib/liblsfg-vk.so'", current_path)
             
             # Write the modified JSON file
             with open(dst_file, 'w') as f:
                 json.dump(json_data, f, indent=2)
                 
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            self.log.error(f"Error fixing JSON file {src_file}: {e}")
-            # Fallback to simple copy if JSON modification fails
-            self._copy_plugin_file(src_file, dst_file)
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+            self.log.error("Error fixing JSON file %s: %s", dst_file.name, e)
+            # Fallback to writing the archive content unchanged if JSON modification fails
+            dst_file.write_bytes(raw_json)
+        
+        dst_file.chmod(0o644)
     
     def _create_config_file(self) -> None:
         """Create or update the TOML config file in ~/.config/lsfg-vk with default configuration and detected DLL path
@@ -194,7 +232,7 @@ class InstallationService(BaseService):
                 # Read existing config to preserve user profiles
                 content = self.config_file_path.read_text(encoding='utf-8')
                 existing_profile_data = ConfigurationManager.parse_toml_content_multi_profile(content)
-                self.log.info(f"Found existing config file, preserving user profiles")
+                self.log.info("Found existing config file, preserving user profiles")
                 
                 # Create merged profile data that preserves user settings but adds any new fields
                 merged_profile_data = self._merge_config_with_defaults(existing_profile_data, dll_service)
@@ -203,7 +241,7 @@ class InstallationService(BaseService):
                 toml_content = ConfigurationManager.generate_toml_content_multi_profile(merged_profile_data)
                 
             except Exception as e:
-                self.log.warning(f"Failed to parse existing config file: {str(e)}, creating new one")
+                self.log.warning("Failed to parse existing config file: %s, creating new one", e)
                 # Fall back to creating a new config file
                 config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
                 toml_content = ConfigurationManager.generate_toml_content(config)
@@ -211,11 +249,11 @@ class InstallationService(BaseService):
             # No existing config file, create a new one with defaults
             config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
             toml_content = ConfigurationManager.generate_toml_content(config)
-            self.log.info(f"Creating new config file")
+            self.log.info("Creating new config file")
         
         # Write config file
-        self._write_file(self.config_file_path, toml_content, 0o644)
-        self.log.info(f"Created config file at {self.config_file_path}")
+        self._atomic_write(self.config_file_path, toml_content, 0o644, durable=True)
+        self.log.info("Created config file at %s", self.config_file_path)
         
         # Log detected DLL path if found - USE GENERATED CONSTANTS
         from .config_schema_generated import DLL
@@ -224,29 +262,19 @@ class InstallationService(BaseService):
             final_content = self.config_file_path.read_text(encoding='utf-8')
             final_config = ConfigurationManager.parse_toml_content(final_content)
             if final_config.get(DLL):
-                self.log.info(f"Configured DLL path: {final_config[DLL]}")
+                self.log.info("Configured DLL path: %s", final_config[DLL])
         except (OSError, IOError, ValueError, KeyError) as e:
             # Don't fail installation if we can't log the DLL path
-            self.log.debug(f"Could not log DLL path: {e}")
+            self.log.debug("Could not log DLL path: %s", e)
     
     def _create_lsfg_launch_script(self) -> None:
         """Create the ~/lsfg launch script for easier game setup"""
-        # Use the default configuration for the initial script
-        from .config_schema import ConfigurationManager
-        default_config = ConfigurationManager.get_defaults()
-        
-        # Create configuration service to generate the script
-        from .configuration import ConfigurationService
-        config_service = ConfigurationService(logger=self.log)
-        config_service.user_home = self.user_home
-        config_service.lsfg_script_path = self.lsfg_launch_script_path
-        
-        # Generate script content with default configuration
-        script_content = config_service._generate_script_content(default_config)
+        from .configuration import get_default_script_content
+        script_content = get_default_script_content()
         
         # Write the script file
-        self._write_file(self.lsfg_launch_script_path, script_content, 0o755)
-        self.log.info(f"Created lsfg launch script at {self.lsfg_launch_script_path}")
+        self._atomic_write(self.lsfg_launch_script_path, script_content, 0o755)
+        self.log.info("Created lsfg launch script at %s", self.lsfg_launch_script_path)
     
     def get_launch_script_path(self) -> str:
         """Get the path to the lsfg launch script
@@ -259,15 +287,31 @@ class InstallationService(BaseService):
     def check_installation(self) -> InstallationCheckResponse:
         """Check if lsfg-vk is already installed
         
+        When the library is missing the remaining files are not checked, and
+        json_exists/script_exists are reported as False.
+        
         Returns:
             InstallationCheckResponse with installation status and file paths
         """
         try:
-            lib_exists = self.lib_file.exists()
+            if not self.lib_file.exists():
+                self.log.info("Installation check: lib=False")
+                return {
+                    "installed": False,
+                    "lib_exists": False,
+                    "json_exists": False,
+                    "script_exists": False,
+                    "lib_path": str(self.lib_file),
+                    "json_path": str(self.json_file),
+                    "script_path": str(self.config_file_path),
+                    "error": None
+                }
+            
+            lib_exists = True
             json_exists = self.json_file.exists()
             config_exists = self.config_file_path.exists()
             
-            self.log.info(f"Installation check: lib={lib_exists}, json={json_exists}, config={config_exists}")
+            self.log.info("Installation check: lib=%s, json=%s, config=%s", lib_exists, json_exists, config_exists)
             
             return {
                 "installed": lib_exists and json_exists,
@@ -303,17 +347,7 @@ class InstallationService(BaseService):
             UninstallationResponse with success status and removed files list
         """
         try:
-            removed_files = []
-            # Remove core lsfg-vk files, but preserve config file to maintain user's custom profiles
-            files_to_remove = [self.lib_file, self.json_file, self.lsfg_launch_script_path]
-            
-            for file_path in files_to_remove:
-                if self._remove_if_exists(file_path):
-                    removed_files.append(str(file_path))
-            
-            # Also try to remove the old script file if it exists (for backward compatibility)
-            if self._remove_if_exists(self.lsfg_script_path):
-                removed_files.append(str(self.lsfg_script_path))
+            removed_files = self._remove_installed_files()
             
             # Don't remove config directory since we're preserving the config file
             
@@ -333,40 +367,54 @@ class InstallationService(BaseService):
             return self._error_response(UninstallationResponse, str(e), 
                                       message="", removed_files=None)
     
+    def _remove_installed_files(self, stop_on_error: bool = True) -> list[str]:
+        """Remove the installed lsfg-vk files, preserving the config file
+        
+        Args:
+            stop_on_error: Re-raise the first removal failure instead of
+                logging it and continuing with the remaining files
+            
+        Returns:
+            List of paths that were actually removed
+            
+        Raises:
+            OSError: If a removal fails and stop_on_error is True
+        """
+        # The launch script and the old script share a path; remove it once
+        files_to_remove = dict.fromkeys([
+            self.lib_file, self.json_file, self.lsfg_launch_script_path, self.lsfg_script_path
+        ])
+        
+        removed_files = []
+        for file_path in files_to_remove:
+            try:
+                if self._remove_if_exists(file_path):
+                    removed_files.append(str(file_path))
+            except OSError:
+                if stop_on_error:
+                    raise
+        return removed_files
+    
     def cleanup_on_uninstall(self) -> None:
         """Clean up lsfg-vk files when the plugin is uninstalled
         
         Note: The config file (conf.toml) is preserved to maintain user's custom profiles
         """
         try:
-            self.log.info("Checking for lsfg-vk files to clean up:")
-            self.log.info(f"  Library file: {self.lib_file}")
-            self.log.info(f"  JSON file: {self.json_file}")
-            self.log.info(f"  Config file: {self.config_file_path} (preserved)")
-            self.log.info(f"  Launch script: {self.lsfg_launch_script_path}")
-            self.log.info(f"  Old script file: {self.lsfg_script_path}")
-            
-            removed_files = []
-            # Remove core lsfg-vk files, but preserve config file to maintain user's custom profiles
-            files_to_remove = [self.lib_file, self.json_file, self.lsfg_launch_script_path, self.lsfg_script_path]
+            # _remove_if_exists logs each path, so only note the preserved config here
+            self.log.info("Checking for lsfg-vk files to clean up (config %s preserved)", self.config_file_path)
             
-            for file_path in files_to_remove:
-                try:
-                    if self._remove_if_exists(file_path):
-                        removed_files.append(str(file_path))
-                except OSError as e:
-                    self.log.error(f"Failed to remove {file_path}: {e}")
+            removed_files = self._remove_installed_files(stop_on_error=False)
             
             # Don't remove config directory since we're preserving the config file
             
             if removed_files:
-                self.log.info(f"Cleaned up {len(removed_files)} lsfg-vk files during plugin uninstall: {removed_files}")
+                self.log.info("Cleaned up %d lsfg-vk files during plugin uninstall: %s", len(removed_files), removed_files)
             else:
                 self.log.info("No lsfg-vk files found to clean up during plugin uninstall")
                 
         except Exception as e:
-            self.log.error(f"Error cleaning up lsfg-vk files during uninstall: {str(e)}")
-            self.log.error(f"Traceback: {traceback.format_exc()}")
+            self.log.exception("Error cleaning up lsfg-vk files during uninstall: %s", e)
 
     def _merge_config_with_defaults(self, existing_profile_data, dll_service):
         """Merge existing user config with current schema defaults
@@ -385,10 +433,12 @@ class InstallationService(BaseService):
         """
         from .config_schema import ProfileData
         
-        # Get current schema defaults
-        default_config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
+        # Get current schema defaults; the DLL is probed once and reused below
+        default_config = ConfigurationManager.get_defaults()
+        dll_result = dll_service.check_lossless_scaling_dll()
+        detected_dll = dll_result["path"] if dll_result.get("detected") and dll_result.get("path") else None
         default_global_config = {
-            "dll": default_config.get("dll", ""),
+            "dll": detected_dll or default_config.get("dll", ""),
             "no_fp16": False
         }
         
@@ -403,15 +453,14 @@ class InstallationService(BaseService):
         for key, default_value in default_global_config.items():
             if key not in merged_data["global_config"]:
                 merged_data["global_config"][key] = default_value
-                self.log.info(f"Added missing global field '{key}' with default value: {default_value}")
+                self.log.info("Added missing global field '%s' with default value: %s", key, default_value)
         
         # Update DLL path if detected
-        dll_result = dll_service.check_lossless_scaling_dll()
-        if dll_result.get("detected") and dll_result.get("path"):
+        if detected_dll:
             old_dll = merged_data["global_config"].get("dll")
-            merged_data["global_config"]["dll"] = dll_result["path"]
-            if old_dll != dll_result["path"]:
-                self.log.info(f"Updated DLL path from '{old_dll}' to: {dll_result['path']}")
+            merged_data["global_config"]["dll"] = detected_dll
+            if old_dll != detected_dll:
+                self.log.info("Updated DLL path from '%s' to: %s", old_dll, detected_dll)
         
         # Merge each profile: preserve user values, add missing fields
         existing_profiles = existing_profile_data.get("profiles", {})
@@ -427,7 +476,7 @@ class InstallationService(BaseService):
                     added_fields.append(key)
             
             if added_fields:
-                self.log.info(f"Profile '{profile_name}': Added missing fields {added_fields}")
+                self.log.info("Profile '%s': Added missing fields %s", profile_name, added_fields)
             
             merged_data["profiles"][profile_name] = merged_profile_config
         
@@ -5,8 +5,8 @@ This plugin provides services for installing and managing the lsfg-vk
 Vulkan layer for frame generation on Steam Deck.
 """
 
+import asyncio
 import os
-import subprocess
 import hashlib
 from typing import Dict, Any
 from pathlib import Path
@@ -35,6 +35,16 @@ class Plugin:
         self.dll_detection_service = DllDetectionService()
         self.configuration_service = ConfigurationService()
         self.flatpak_service = FlatpakService()
+        self._config_lock = asyncio.Lock()
+
+    async def _run_config_io(self, func, *args) -> Dict[str, Any]:
+        """Run a call that touches the config file or launch script in a worker thread
+
+        Calls are serialized so read-modify-write updates of the config file,
+        including the ones done by install and uninstall, never interleave.
+        """
+        async with self._config_lock:
+            return await asyncio.to_thread(func, *args)
 
     async def install_lsfg_vk(self) -> Dict[str, Any]:
         """Install lsfg-vk by extracting the zip file to ~/.local
@@ -42,7 +52,9 @@ class Plugin:
         Returns:
             InstallationResponse dict with success status and message/error
         """
-        return self.installation_service.install()
+        result = await self._run_config_io(self.installation_service.install)
+        self.dll_detection_service.clear_cache()
+        return result
 
     async def check_lsfg_vk_installed(self) -> Dict[str, Any]:
         """Check if lsfg-vk is already installed
@@ -50,7 +62,7 @@ class Plugin:
         Returns:
             InstallationCheckResponse dict with installation status and paths
         """
-        return self.installation_service.check_installation()
+        return await asyncio.to_thread(self.installation_service.check_installation)
 
     async def uninstall_lsfg_vk(self) -> Dict[str, Any]:
         """Uninstall lsfg-vk by removing the installed files
@@ -58,7 +70,9 @@ class Plugin:
         Returns:
             UninstallationResponse dict with success status and removed files
         """
-        return self.installation_service.uninstall()
+        result = await self._run_config_io(self.installation_service.uninstall)
+        self.dll_detection_service.clear_cache()
+        return result
 
     async def check_lossless_scaling_dll(self) -> Dict[str, Any]:
         """Check if Lossless Scaling DLL is available at the expected paths
@@ -66,7 +80,7 @@ class Plugin:
         Returns:
             DllDetectionResponse dict with detection status and path info
         """
-        return self.dll_detection_service.check_lossless_scaling_dll()
+        return await asyncio.to_thread(self.dll_detection_service.check_lossless_scaling_dll)
 
     async def get_dll_stats(self) -> Dict[str, Any]:
         """Get detailed statistics about the detected DLL
@@ -74,6 +88,10 @@ class Plugin:
         Returns:
             Dict containing DLL path, SHA256 hash, and other stats
         """
+        return await asyncio.to_thread(self._get_dll_stats_sync)
+
+    def _get_dll_stats_sync(self) -> Dict[str, Any]:
+        """Blocking part of get_dll_stats: detect the DLL and hash it"""
         try:
             dll_result = self.dll_detection_service.check_lossless_scaling_dll()
             
@@ -132,7 +150,7 @@ class Plugin:
         Returns:
             ConfigurationResponse dict with current configuration or error
         """
-        return self.configuration_service.get_config()
+        return await self._run_config_io(self.configuration_service.get_config)
 
     async def get_config_schema(self) -> Dict[str, Any]:
         """Get configuration schema information for frontend
@@ -141,7 +159,7 @@ class Plugin:
             Dict with field names, types, defaults, and profile information
         """
         try:
-            profiles_response = self.configuration_service.get_profiles()
+            profiles_response = await self._run_config_io(self.configuration_service.get_profiles)
             
             schema_data = {
                 "field_names": ConfigurationManager.get_field_names(),
@@ -179,7 +197,7 @@ class Plugin:
         """
         validated_config = ConfigurationManager.validate_config(config)
         
-        return self.configuration_service.update_config_from_dict(validated_config)
+        return await self._run_config_io(self.configuration_service.update_config_from_dict, validated_config)
 
     async def get_profiles(self) -> Dict[str, Any]:
         """Get list of all profiles and current profile
@@ -187,7 +205,7 @@ class Plugin:
         Returns:
             ProfilesResponse dict with profile list and current profile
         """
-        return self.configuration_service.get_profiles()
+        return await self._run_config_io(self.configuration_service.get_profiles)
 
     async def create_profile(self, profile_name: str, source_profile: str = None) -> Dict[str, Any]:
         """Create a new profile
@@ -199,7 +217,7 @@ class Plugin:
         Returns:
             ProfileResponse dict with success status
         """
-        return self.configuration_service.create_profile(profile_name, source_profile)
+        return await self._run_config_io(self.configuration_service.create_profile, profile_name, source_profile)
 
     async def delete_profile(self, profile_name: str) -> Dict[str, Any]:
         """Delete a profile
@@ -210,7 +228,7 @@ class Plugin:
         Returns:
             ProfileResponse dict with success status
         """
-        return self.configuration_service.delete_profile(profile_name)
+        return await self._run_config_io(self.configuration_service.delete_profile, profile_name)
 
     async def rename_profile(self, old_name: str, new_name: str) -> Dict[str, Any]:
         """Rename a profile
@@ -222,7 +240,7 @@ class Plugin:
         Returns:
             ProfileResponse dict with success status
         """
-        return self.configuration_service.rename_profile(old_name, new_name)
+        return await self._run_config_io(self.configuration_service.rename_profile, old_name, new_name)
 
     async def set_current_profile(self, profile_name: str) -> Dict[str, Any]:
         """Set the current active profile
@@ -233,7 +251,7 @@ class Plugin:
         Returns:
             ProfileResponse dict with success status
         """
-        return self.configuration_service.set_current_profile(profile_name)
+        return await self._run_config_io(self.configuration_service.set_current_profile, profile_name)
 
     async def update_profile_config(self, profile_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Update configuration for a specific profile
@@ -247,7 +265,7 @@ class Plugin:
         """
         validated_config = ConfigurationManager.validate_config(config)
         
-        return self.configuration_service.update_profile_config(profile_name, validated_config)
+        return await self._run_config_io(self.configuration_service.update_profile_config, profile_name, validated_config)
 
     async def get_launch_option(self) -> Dict[str, Any]:
         """Get the launch option that users need to set for their games
@@ -267,6 +285,10 @@ class Plugin:
         Returns:
             Dict containing the config file content or error message
         """
+        return await self._run_config_io(self._get_config_file_content_sync)
+
+    def _get_config_file_content_sync(self) -> Dict[str, Any]:
+        """Blocking part of get_config_file_content: read conf.toml"""
         try:
             config_path = self.configuration_service.config_file_path
             if not config_path.exists():
@@ -298,6 +320,10 @@ class Plugin:
         Returns:
             FileContentResponse dict with file content or error information
         """
+        return await self._run_config_io(self._get_launch_script_content_sync)
+
+    def _get_launch_script_content_sync(self) -> Dict[str, Any]:
+        """Blocking part of get_launch_script_content: read the ~/lsfg script"""
         try:
             script_path = self.installation_service.get_launch_script_path()
             
@@ -356,7 +382,7 @@ class Plugin:
         Returns:
             FlatpakExtensionStatus dict with installation status for both runtime versions
         """
-        return self.flatpak_service.get_extension_status()
+        return await asyncio.to_thread(self.flatpak_service.get_extension_status)
 
     async def install_flatpak_extension(self, version: str) -> Dict[str, Any]:
         """Install lsfg-vk Flatpak runtime extension
@@ -367,7 +393,7 @@ class Plugin:
         Returns:
             BaseResponse dict with success status and message/error
         """
-        return self.flatpak_service.install_extension(version)
+        return await asyncio.to_thread(self.flatpak_service.install_extension, version)
 
     async def uninstall_flatpak_extension(self, version: str) -> Dict[str, Any]:
         """Uninstall lsfg-vk Flatpak runtime extension
@@ -378,7 +404,7 @@ class Plugin:
         Returns:
             BaseResponse dict with success status and message/error
         """
-        return self.flatpak_service.uninstall_extension(version)
+        return await asyncio.to_thread(self.flatpak_service.uninstall_extension, version)
 
     async def get_flatpak_apps(self) -> Dict[str, Any]:
         """Get list of installed Flatpak apps and their lsfg-vk override status
@@ -386,7 +412,7 @@ class Plugin:
         Returns:
             FlatpakAppInfo dict with apps list and override status
         """
-        return self.flatpak_service.get_flatpak_apps()
+        return await asyncio.to_thread(self.flatpak_service.get_flatpak_apps)
 
     async def set_flatpak_app_override(self, app_id: str) -> Dict[str, Any]:
         """Set lsfg-vk overrides for a Flatpak app
@@ -397,7 +423,7 @@ class Plugin:
         Returns:
             FlatpakOverrideResponse dict with operation result
         """
-        return self.flatpak_service.set_app_override(app_id)
+        return await asyncio.to_thread(self.flatpak_service.set_app_override, app_id)
 
     async def remove_flatpak_app_override(self, app_id: str) -> Dict[str, Any]:
         """Remove lsfg-vk overrides for a Flatpak app
@@ -408,7 +434,7 @@ class Plugin:
         Returns:
             FlatpakOverrideResponse dict with operation result
         """
-        return self.flatpak_service.remove_app_override(app_id)
+        return await asyncio.to_thread(self.flatpak_service.remove_app_override, app_id)
     
     async def _main(self):
         """
@@ -438,18 +464,18 @@ class Plugin:
         decky.logger.info("decky-lsfg-vk plugin being uninstalled")
         
         # Clean up lsfg-vk files when the plugin is uninstalled
-        self.installation_service.cleanup_on_uninstall()
+        await self._run_config_io(self.installation_service.cleanup_on_uninstall)
         
         # Also clean up flatpak extensions if they are installed
         try:
             decky.logger.info("Checking for flatpak extensions to uninstall")
             
-            extension_status = self.flatpak_service.get_extension_status()
+            extension_status = await asyncio.to_thread(self.flatpak_service.get_extension_status)
             
             if extension_status.get("success"):
                 if extension_status.get("installed_23_08"):
                     decky.logger.info("Uninstalling lsfg-vk flatpak runtime 23.08")
-                    result = self.flatpak_service.uninstall_extension("23.08")
+                    result = await asyncio.to_thread(self.flatpak_service.uninstall_extension, "23.08")
                     if result.get("success"):
                         decky.logger.info("Successfully uninstalled flatpak runtime 23.08")
                     else:
@@ -457,7 +483,7 @@ class Plugin:
                 
                 if extension_status.get("installed_24_08"):
                     decky.logger.info("Uninstalling lsfg-vk flatpak runtime 24.08")
-                    result = self.flatpak_service.uninstall_extension("24.08")
+                    result = await asyncio.to_thread(self.flatpak_service.uninstall_extension, "24.08")
                     if result.get("success"):
                         decky.logger.info("Successfully uninstalled flatpak runtime 24.08")
                     else:
@@ -468,7 +494,7 @@ class Plugin:
                 decky.logger.info(f"Could not check flatpak status for cleanup: {extension_status.get('error')}")
                 
         except Exception as e:
-            decky.logger.error(f"Error during flatpak cleanup: {e}")
+            decky.logger.exception(f"Error during flatpak cleanup: {e}")
         
         decky.logger.info("decky-lsfg-vk plugin uninstall cleanup completed")
 
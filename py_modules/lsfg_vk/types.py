@@ -25,6 +25,13 @@ class InstallationResponse(BaseResponse):
     """Response for installation operations"""
     message: str
     error: Optional[str]
+    installed: Optional[bool]
+    lib_exists: Optional[bool]
+    json_exists: Optional[bool]
+    script_exists: Optional[bool]
+    lib_path: Optional[str]
+    json_path: Optional[str]
+    script_path: Optional[str]
 
 
 class UninstallationResponse(BaseResponse):
@@ -16,30 +16,33 @@ sys.path.insert(0, str(project_root))
 from shared_config import CONFIG_SCHEMA_DEF, ConfigFieldType
 
 
+_PYTHON_TYPE_MAP = {
+    ConfigFieldType.BOOLEAN: "bool",
+    ConfigFieldType.INTEGER: "int",
+    ConfigFieldType.FLOAT: "float",
+    ConfigFieldType.STRING: "str"
+}
+
+_ENV_VAR_MAP = {
+    "dxvk_frame_rate": "DXVK_FRAME_RATE",
+    "enable_wow64": "PROTON_USE_WOW64",
+    "disable_steamdeck_mode": "SteamDeck",
+    "mangohud_workaround": "MANGOHUD",
+    "disable_vkbasalt": "DISABLE_VKBASALT",
+    "force_enable_vkbasalt": "ENABLE_VKBASALT",
+    "enable_wsi": "ENABLE_GAMESCOPE_WSI",
+    "enable_zink": "ZINK_ENABLE"
+}
+
+
 def get_python_type(field_type: ConfigFieldType) -> str:
     """Convert ConfigFieldType to Python type annotation"""
-    type_map = {
-        ConfigFieldType.BOOLEAN: "bool",
-        ConfigFieldType.INTEGER: "int", 
-        ConfigFieldType.FLOAT: "float",
-        ConfigFieldType.STRING: "str"
-    }
-    return type_map.get(field_type, "Any")
+    return _PYTHON_TYPE_MAP.get(field_type, "Any")
 
 
 def get_env_var_name(field_name: str) -> str:
     """Convert field name to environment variable name"""
-    env_map = {
-        "dxvk_frame_rate": "DXVK_FRAME_RATE",
-        "enable_wow64": "PROTON_USE_WOW64", 
-        "disable_steamdeck_mode": "SteamDeck",
-        "mangohud_workaround": "MANGOHUD",
-        "disable_vkbasalt": "DISABLE_VKBASALT",
-        "force_enable_vkbasalt": "ENABLE_VKBASALT",
-        "enable_wsi": "ENABLE_GAMESCOPE_WSI",
-        "enable_zink": "ZINK_ENABLE"
-    }
-    return env_map.get(field_name, field_name.upper())
+    return _ENV_VAR_MAP.get(field_name, field_name.upper())
 
 
 def generate_typed_dict() -> str:
@@ -57,7 +60,10 @@ def generate_typed_dict() -> str:
 
 
 def generate_script_parsing() -> str:
-    """Generate script content parsing logic"""
+    """Generate the env var -> (field, converter) dispatch table entries
+
+    Converters raise ValueError to leave the field unset.
+    """
     lines = []
     
     script_fields = [
@@ -73,40 +79,24 @@ def generate_script_parsing() -> str:
         if field_type == ConfigFieldType.BOOLEAN:
             if field_name == "disable_steamdeck_mode":
                 # Special case: SteamDeck=0 means disable_steamdeck_mode=True
-                lines.append(f'                    elif key == "{env_var}":')
-                lines.append(f'                        script_values["{field_name}"] = value == "0"')
+                lines.append(f'    "{env_var}": ("{field_name}", _equals("0")),')
             elif field_name == "enable_wsi":
                 # Special case: ENABLE_GAMESCOPE_WSI=0 or DXVK_HDR=0 means enable_wsi=False
-                lines.append(f'                    elif key == "{env_var}":')
-                lines.append(f'                        script_values["{field_name}"] = value != "0"')
-                lines.append(f'                    elif key == "DXVK_HDR":')
-                lines.append(f'                        script_values["{field_name}"] = value != "0"')
+                lines.append(f'    "{env_var}": ("{field_name}", _not_equals("0")),')
+                lines.append(f'    "DXVK_HDR": ("{field_name}", _not_equals("0")),')
             elif field_name == "enable_zink":
                 # Special case: Zink uses multiple environment variables
-                lines.append(f'                    elif key == "__GLX_VENDOR_LIBRARY_NAME" and value == "mesa":')
-                lines.append(f'                        script_values["{field_name}"] = True')
-                lines.append(f'                    elif key == "MESA_LOADER_DRIVER_OVERRIDE" and value == "zink":')
-                lines.append(f'                        script_values["{field_name}"] = True')
-                lines.append(f'                    elif key == "GALLIUM_DRIVER" and value == "zink":')
-                lines.append(f'                        script_values["{field_name}"] = True')
+                lines.append(f'    "__GLX_VENDOR_LIBRARY_NAME": ("{field_name}", _only_if("mesa")),')
+                lines.append(f'    "MESA_LOADER_DRIVER_OVERRIDE": ("{field_name}", _only_if("zink")),')
+                lines.append(f'    "GALLIUM_DRIVER": ("{field_name}", _only_if("zink")),')
             else:
-                lines.append(f'                    elif key == "{env_var}":')
-                lines.append(f'                        script_values["{field_name}"] = value == "1"')
+                lines.append(f'    "{env_var}": ("{field_name}", _equals("1")),')
         elif field_type == ConfigFieldType.INTEGER:
-            lines.append(f'                    elif key == "{env_var}":')
-            lines.append('                        try:')
-            lines.append(f'                            script_values["{field_name}"] = int(value)')
-            lines.append('                        except ValueError:')
-            lines.append('                            pass')
+            lines.append(f'    "{env_var}": ("{field_name}", int),')
         elif field_type == ConfigFieldType.FLOAT:
-            lines.append(f'                    elif key == "{env_var}":')
-            lines.append('                        try:')
-            lines.append(f'                            script_values["{field_name}"] = float(value)')
-            lines.append('                        except ValueError:')
-            lines.append('                            pass')
+            lines.append(f'    "{env_var}": ("{field_name}", float),')
         elif field_type == ConfigFieldType.STRING:
-            lines.append(f'                    elif key == "{env_var}":')
-            lines.append(f'                        script_values["{field_name}"] = value')
+            lines.append(f'    "{env_var}": ("{field_name}", str),')
     
     return "\n".join(lines)
 
@@ -163,8 +153,13 @@ def generate_script_generation() -> str:
     return "\n".join(lines)
 
 
-def generate_complete_schema_file() -> str:
-    """Generate complete config_schema_generated.py file"""
+def generate_complete_schema_file(schema_hash: str = "") -> str:
+    """Generate complete config_schema_generated.py file
+
+    Args:
+        schema_hash: Input hash from generate_ts_schema.py, stamped into the
+            header so it can tell whether this file is current
+    """
     
     # Generate field name constants
     field_constants = []
@@ -177,9 +172,11 @@ def generate_complete_schema_file() -> str:
         'Auto-generated configuration schema components from shared_config.py',
         'DO NOT EDIT THIS FILE MANUALLY - it will be overwritten on build',
         '"""',
+    ] + ([f'# schema-hash: {schema_hash}'] if schema_hash else []) + [
         '',
         'from typing import TypedDict, Dict, Any, Union',
         'from enum import Enum',
+        'import re',
         'import sys',
         'from pathlib import Path',
         '',
@@ -194,22 +191,48 @@ def generate_complete_schema_file() -> str:
         generate_typed_dict(),
         '',
         '',
+        '# Matches uncommented "export KEY=VALUE" lines in the launch script',
+        '_EXPORT_RE = re.compile(r"^[ \\t]*export[ \\t]+([^=\\n]*)=(.*)$", re.MULTILINE)',
+        '',
+        '',
+        'def _equals(expected):',
+        '    """Converter: True when the value equals expected"""',
+        '    return lambda value: value == expected',
+        '',
+        '',
+        'def _not_equals(expected):',
+        '    """Converter: True unless the value equals expected"""',
+        '    return lambda value: value != expected',
+        '',
+        '',
+        'def _only_if(expected):',
+        '    """Converter: True when the value equals expected, otherwise leave the field unset"""',
+        '    def convert(value):',
+        '        if value != expected:',
+        '            raise ValueError(value)',
+        '        return True',
+        '    return convert',
+        '',
+        '',
+        '# Auto-generated env var -> (field name, converter) dispatch table',
+        '_SCRIPT_PARSERS = {',
+        generate_script_parsing(),
+        '}',
+        '',
+        '',
         'def get_script_parsing_logic():',
         '    """Return the script parsing logic as a callable"""',
-        '    def parse_script_values(lines):', 
+        '    def parse_script_values(content):',
         '        script_values = {}',
-        '        for line in lines:',
-        '            line = line.strip()',
-        '            if not line or line.startswith("#") or not line.startswith("export "):',
+        '        for match in _EXPORT_RE.finditer(content):',
+        '            parser = _SCRIPT_PARSERS.get(match.group(1).strip())',
+        '            if parser is None:',
         '                continue',
-        '            if "=" in line:',
-        '                export_line = line[len("export "):]', 
-        '                key, value = export_line.split("=", 1)',
-        '                key = key.strip()',
-        '                value = value.strip()',
-        '',
-        '                # Auto-generated parsing logic:',
-        f'{generate_script_parsing().replace("                    elif", "                if")}',
+        '            field_name, convert = parser',
+        '            try:',
+        '                script_values[field_name] = convert(match.group(2).strip())',
+        '            except ValueError:',
+        '                pass',
         '',
         '        return script_values',
         '    return parse_script_values',
@@ -232,16 +255,21 @@ def generate_complete_schema_file() -> str:
 
 
 def main():
-    """Generate complete Python configuration files"""
+    """Generate complete Python configuration files
+
+    Usage: generate_python_boilerplate.py [schema_hash [output_path]]
+    """
     try:
-        # Create generated files in py_modules/lsfg_vk/
-        target_dir = project_root / "py_modules" / "lsfg_vk"
+        schema_hash = sys.argv[1] if len(sys.argv) > 1 else ""
+        
+        # Create generated files in py_modules/lsfg_vk/ unless told otherwise
+        default_file = project_root / "py_modules" / "lsfg_vk" / "config_schema_generated.py"
+        schema_file = Path(sys.argv[2]) if len(sys.argv) > 2 else default_file
 
         # Generate the complete schema file
-        schema_content = generate_complete_schema_file()
-        schema_file = target_dir / "config_schema_generated.py"
+        schema_content = generate_complete_schema_file(schema_hash)
         schema_file.write_text(schema_content)
-        print(f"Generated {schema_file.relative_to(project_root)}")
+        print(f"Generated {schema_file}")
         
     except Exception as e:
         print(f"❌ Error generating Python files: {e}")
@@ -6,7 +6,11 @@ This script reads the canonical schema from shared_config.py and generates
 the corresponding TypeScript files, ensuring single source of truth.
 """
 
+import hashlib
+import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path to import shared_config
@@ -15,19 +19,102 @@ sys.path.insert(0, str(project_root))
 
 from shared_config import CONFIG_SCHEMA_DEF, ConfigFieldType
 
+DEFAULT_TARGET = project_root / "src" / "config" / "generatedConfigSchema.ts"
+BOILERPLATE_SCRIPT = project_root / "scripts" / "generate_python_boilerplate.py"
+BOILERPLATE_TARGET = project_root / "py_modules" / "lsfg_vk" / "config_schema_generated.py"
+HASH_MARKER = "// schema-hash: "
+PY_HASH_MARKER = "# schema-hash: "
 
-def generate_typescript_schema():
+_SCHEMA_ITEMS = tuple(CONFIG_SCHEMA_DEF.items())
+
+_TS_TYPE_MAP = {
+    ConfigFieldType.BOOLEAN: "boolean",
+    ConfigFieldType.INTEGER: "number",
+    ConfigFieldType.FLOAT: "number",
+    ConfigFieldType.STRING: "string",
+}
+
+
+def _ts_string(value: str) -> str:
+    """Quote and escape a string as a TypeScript literal"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+_DEFAULT_FORMATTERS = {
+    ConfigFieldType.STRING: _ts_string,
+    ConfigFieldType.BOOLEAN: lambda v: "true" if v else "false",
+    ConfigFieldType.INTEGER: str,
+    ConfigFieldType.FLOAT: str,
+}
+
+# Per-field templates, filled from one precomputed dict per field
+_FIELD_TEMPLATE = (
+    '  {field_name}: {{\n'
+    '    name: {name},\n'
+    '    fieldType: ConfigFieldType.{type_upper},\n'
+    '    default: {default_str},\n'
+    '    description: {description}\n'
+    '  }},'
+)
+_INTERFACE_TEMPLATE = '  {field_name}: {ts_type};'
+_DEFAULTS_TEMPLATE = '    {field_name}: {default_str},'
+_FIELD_TYPES_TEMPLATE = '    {field_name}: ConfigFieldType.{type_upper},'
+
+
+@lru_cache(maxsize=None, typed=True)
+def _fmt_default(field_type: ConfigFieldType, value) -> str:
+    """Format a default value as a TypeScript literal
+
+    Raises:
+        KeyError: If the field type has no TypeScript formatter
+    """
+    return _DEFAULT_FORMATTERS[field_type](value)
+
+
+def compute_schema_hash() -> str:
+    """Hash every input that affects the generated files"""
+    digest = hashlib.blake2b(digest_size=16)
+    for source in (Path(__file__), project_root / "shared_config.py", BOILERPLATE_SCRIPT):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _has_marker(path: Path, marker: str) -> bool:
+    """Check whether a generated file's header carries the given hash marker"""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(512)
+    except FileNotFoundError:
+        return False
+    return marker.encode() in head
+
+
+def is_up_to_date(target_file: Path, py_target_file: Path, schema_hash: str) -> bool:
+    """Check whether both files this run would write were produced from the current inputs"""
+    return (_has_marker(target_file, f"{HASH_MARKER}{schema_hash}")
+            and _has_marker(py_target_file, f"{PY_HASH_MARKER}{schema_hash}"))
+
+
+def write_atomic(target_file: Path, content: str) -> None:
+    """Write content next to the target and swap it into place"""
+    tmp_file = target_file.with_name(target_file.name + ".tmp")
+    tmp_file.write_text(content)
+    os.replace(tmp_file, target_file)
+
+
+def generate_typescript_schema(schema_hash: str = ""):
     """Generate generatedConfigSchema.ts from Python schema"""
     
     # Generate field name constants
     field_constants = []
-    for field_name in CONFIG_SCHEMA_DEF.keys():
+    for field_name, _ in _SCHEMA_ITEMS:
         const_name = field_name.upper()
         field_constants.append(f'export const {const_name} = "{field_name}" as const;')
     
     # Generate enum
     enum_lines = [
         "// src/config/generatedConfigSchema.ts",
+    ] + ([f"{HASH_MARKER}{schema_hash}"] if schema_hash else []) + [
         "// Configuration field type enum - matches Python",
         "export enum ConfigFieldType {",
         "  BOOLEAN = \"boolean\",",
@@ -51,44 +138,27 @@ def generate_typescript_schema():
         "export const CONFIG_SCHEMA: Record<string, ConfigField> = {"
     ]
     
-    # Generate schema entries
+    # Generate every section in a single pass over the schema
     schema_entries = []
     interface_fields = []
     defaults_fields = []
     field_types = []
     
-    for field_name, field_def in CONFIG_SCHEMA_DEF.items():
-        # Schema entry
-        default_value = field_def["default"]
-        if isinstance(default_value, str):
-            default_str = f'"{default_value}"'
-        elif isinstance(default_value, bool):
-            default_str = "true" if default_value else "false"
-        else:
-            default_str = str(default_value)
-            
-        schema_entries.append(f'  {field_name}: {{')
-        schema_entries.append(f'    name: "{field_def["name"]}",')
-        schema_entries.append(f'    fieldType: ConfigFieldType.{field_def["fieldType"].upper()},')
-        schema_entries.append(f'    default: {default_str},')
-        schema_entries.append(f'    description: "{field_def["description"]}"')
-        schema_entries.append('  },')
+    for field_name, field_def in _SCHEMA_ITEMS:
+        field_type = field_def["fieldType"]
+        values = {
+            "field_name": field_name,
+            "name": _ts_string(field_def["name"]),
+            "type_upper": field_type.upper(),
+            "default_str": _fmt_default(field_type, field_def["default"]),
+            "description": _ts_string(field_def["description"]),
+            "ts_type": _TS_TYPE_MAP.get(field_type, "any"),
+        }
         
-        # Interface field
-        if field_def["fieldType"] == ConfigFieldType.BOOLEAN:
-            ts_type = "boolean"
-        elif field_def["fieldType"] == ConfigFieldType.INTEGER:
-            ts_type = "number"
-        elif field_def["fieldType"] == ConfigFieldType.FLOAT:
-            ts_type = "number"
-        elif field_def["fieldType"] == ConfigFieldType.STRING:
-            ts_type = "string"
-        else:
-            ts_type = "any"
-            
-        interface_fields.append(f'  {field_name}: {ts_type};')
-        defaults_fields.append(f'    {field_name}: {default_str},')
-        field_types.append(f'    {field_name}: ConfigFieldType.{field_def["fieldType"].upper()},')
+        schema_entries.append(_FIELD_TEMPLATE.format_map(values))
+        interface_fields.append(_INTERFACE_TEMPLATE.format_map(values))
+        defaults_fields.append(_DEFAULTS_TEMPLATE.format_map(values))
+        field_types.append(_FIELD_TYPES_TEMPLATE.format_map(values))
     
     # Complete the file
     all_lines = enum_lines + schema_entries + [
@@ -123,32 +193,42 @@ def generate_typescript_schema():
 
 
 def main():
-    """Main function to generate TypeScript schema and Python boilerplate"""
+    """Main function to generate TypeScript schema and Python boilerplate
+
+    Usage: generate_ts_schema.py [output_path [python_output_path]]
+    """
     try:
-        # Generate the TypeScript content
-        ts_content = generate_typescript_schema()
-        
-        # Write to the target file
-        target_file = project_root / "src" / "config" / "generatedConfigSchema.ts"
-        target_file.write_text(ts_content)
+        target_file = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TARGET
+        py_target_file = Path(sys.argv[2]) if len(sys.argv) > 2 else BOILERPLATE_TARGET
+        schema_hash = compute_schema_hash()
         
-        print(f"✅ Generated {target_file} from shared_config.py")
-        print(f"   Fields: {len(CONFIG_SCHEMA_DEF)}")
+        # Skip regeneration entirely when none of the inputs changed
+        if is_up_to_date(target_file, py_target_file, schema_hash):
+            print(f"✅ {target_file} is up to date")
+            return
         
-        # Also generate Python boilerplate
-        print("\n🔄 Generating Python boilerplate...")
-        from pathlib import Path
+        # Generate the Python boilerplate first; the TypeScript file carries
+        # the hash that marks both as current, so it is only written once
+        # the boilerplate is known to be good
+        print("🔄 Generating Python boilerplate...")
         import subprocess
         
-        boilerplate_script = project_root / "scripts" / "generate_python_boilerplate.py"
-        result = subprocess.run([sys.executable, str(boilerplate_script)], 
+        result = subprocess.run([sys.executable, str(BOILERPLATE_SCRIPT), schema_hash, str(py_target_file)], 
                               capture_output=True, text=True)
         
-        if result.returncode == 0:
-            print(result.stdout)
-        else:
-            print(f"⚠️  Python boilerplate generation had issues:\n{result.stderr}")
+        if result.returncode != 0:
+            print(f"❌ Python boilerplate generation failed:\n{result.stdout}{result.stderr}")
+            sys.exit(1)
+        print(result.stdout)
+        
+        # Generate the TypeScript content
+        ts_content = generate_typescript_schema(schema_hash)
+        
+        # Write to the target file
+        write_atomic(target_file, ts_content)
         
+        print(f"✅ Generated {target_file} from shared_config.py")
+        print(f"   Fields: {len(CONFIG_SCHEMA_DEF)}")
     except Exception as e:
         print(f"❌ Error generating schema: {e}")
         sys.exit(1)
@@ -7,6 +7,14 @@ export interface InstallationResult {
   error?: string;
   message?: string;
   removed_files?: string[];
+  // Installation status fields returned by install_lsfg_vk on success
+  installed?: boolean;
+  lib_exists?: boolean;
+  json_exists?: boolean;
+  script_exists?: boolean;
+  lib_path?: string;
+  json_path?: string;
+  script_path?: string;
 }
 
 export interface InstallationStatus {
@@ -1,4 +1,5 @@
 // src/config/generatedConfigSchema.ts
+// schema-hash: f917ce7423ee23a32f95e03a2e2a22f3
 // Configuration field type enum - matches Python
 export enum ConfigFieldType {
   BOOLEAN = "boolean",